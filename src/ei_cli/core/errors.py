@@ -22,6 +22,7 @@ Sprint 4.1 Enhancements:
 import functools
 import json
 import logging
+import time
 from collections.abc import Callable
 from datetime import UTC, datetime
 from enum import Enum
@@ -88,27 +89,48 @@ class VibeError(Exception):
         self.recoverable = recoverable
         self.context = context or {}
         self.suggestion = suggestion
-        self.timestamp = datetime.now(UTC).isoformat()
+        # A raw nanosecond stamp is much cheaper than building a
+        # datetime; the ISO string is formatted lazily on first access
+        self._ts_ns = time.time_ns()
+        self._timestamp: str | None = None
+        self._cached_dict: dict[str, Any] | None = None
+
+    @property
+    def timestamp(self) -> str:
+        """ISO-8601 timestamp of when the error was created."""
+        if self._timestamp is None:
+            self._timestamp = datetime.fromtimestamp(
+                self._ts_ns / 1e9, tz=UTC,
+            ).isoformat()
+        return self._timestamp
 
     def to_dict(self) -> dict[str, Any]:
         """
         Convert error to JSON-serializable dict.
 
+        The dict is built once per instance and memoized, so logging
+        an error and then serializing it for output pays the cost once.
+
         Returns:
             Dict with error details for AI consumption or logging
         """
-        result = {
-            "message": self.message,
-            "code": self.code,
-            "recoverable": self.recoverable,
-            "context": self.context,
-            "timestamp": self.timestamp,
-        }
-
-        if self.suggestion:
-            result["suggestion"] = self.suggestion
-
-        return result
+        if self._cached_dict is None:
+            result = {
+                "message": self.message,
+                "code": self.code,
+                "recoverable": self.recoverable,
+                "context": self.context,
+                "timestamp": self.timestamp,
+            }
+
+            if self.suggestion:
+                result["suggestion"] = self.suggestion
+
+            self._cached_dict = result
+
+        # Hand out a copy so callers mutating the result can't corrupt
+        # the memoized dict behind later to_dict()/to_json() calls
+        return dict(self._cached_dict)
 
     def to_json(self) -> str:
         """
@@ -7,6 +7,7 @@ than simple fixed-window approaches.
 import threading
 import time
 from collections import deque
+from collections.abc import Callable
 
 
 class RateLimiter:
@@ -17,18 +18,28 @@ class RateLimiter:
     more accurately than simple counters.
     """
 
-    def __init__(self, max_requests: int, window_seconds: int = 60):
+    def __init__(
+        self,
+        max_requests: int,
+        window_seconds: int = 60,
+        time_func: Callable[[], float] = time.time,
+        sleep_func: Callable[[float], None] = time.sleep,
+    ):
         """
         Initialize rate limiter.
 
         Args:
             max_requests: Maximum number of requests allowed in window
             window_seconds: Time window in seconds (default: 60)
+            time_func: Clock used for timestamps (injectable for tests)
+            sleep_func: Sleep used by wait_if_needed (injectable for tests)
         """
         self.max_requests = max_requests
         self.window_seconds = window_seconds
         self.requests: deque[float] = deque()
         self._lock = threading.Lock()
+        self._time = time_func
+        self._sleep = sleep_func
 
     def can_proceed(self) -> tuple[bool, float]:
         """
@@ -39,7 +50,7 @@ class RateLimiter:
             - can_proceed: True if request can proceed
             - wait_seconds: Seconds to wait if cannot proceed (0 if can)
         """
-        now = time.time()
+        now = self._time()
 
         with self._lock:
             # Remove requests outside the window
@@ -67,10 +78,10 @@ class RateLimiter:
         can_proceed, wait_time = self.can_proceed()
 
         if not can_proceed and wait_time > 0:
-            time.sleep(wait_time)
+            self._sleep(wait_time)
             # After waiting, mark the request
             with self._lock:
-                self.requests.append(time.time())
+                self.requests.append(self._time())
             return wait_time
 
         return 0.0
@@ -87,7 +98,7 @@ class RateLimiter:
         Returns:
             Number of active requests
         """
-        now = time.time()
+        now = self._time()
         cutoff = now - self.window_seconds
 
         with self._lock:
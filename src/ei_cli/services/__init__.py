@@ -16,6 +16,7 @@ from ei_cli.services.base import (
 from ei_cli.services.factory import ServiceFactory
 from ei_cli.services.image_service import (
     CropResult,
+    ImageHandle,
     ImageService,
     OptimizeResult,
     RemoveBgResult,
@@ -24,6 +25,7 @@ from ei_cli.services.image_service import (
 __all__ = [
     "AIService",
     "CropResult",
+    "ImageHandle",
     "ImageService",
     "OptimizeResult",
     "RateLimitError",
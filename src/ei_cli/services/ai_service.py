@@ -13,7 +13,7 @@ import tempfile
 from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import backoff
 from aiolimiter import AsyncLimiter
@@ -34,6 +34,9 @@ from ei_cli.services.constants import (
     MIN_TTS_SPEED,
 )
 
+if TYPE_CHECKING:
+    from ei_cli.services.image_downloader import ImageDownloader
+
 
 @dataclass
 class SearchCitation:
@@ -137,6 +140,7 @@ class AIService(Service):
         # 60 second window matches RateLimiter default
         self._async_rate_limiter = AsyncLimiter(max_rate=rate_limit, time_period=60)
         self._audio_processor: AudioProcessor | None = None
+        self._downloader: ImageDownloader | None = None
         self._total_cost = 0.0
         
         # Phase 4: Intelligent caching system
@@ -190,6 +194,20 @@ class AIService(Service):
             self._async_client = AsyncOpenAI(api_key=self._api_key)
         return self._async_client
 
+    def _get_downloader(self) -> "ImageDownloader":
+        """
+        Get or create the shared image downloader.
+
+        One instance per service keeps a single persistent httpx.Client
+        alive across vision requests instead of leaking a new client
+        (and its connection pool) on every call.
+        """
+        if self._downloader is None:
+            from ei_cli.services.image_downloader import ImageDownloader
+
+            self._downloader = ImageDownloader()
+        return self._downloader
+
     def _get_audio_processor(self) -> AudioProcessor:
         """Get or create audio processor."""
         if self._audio_processor is None:
@@ -465,10 +483,8 @@ class AIService(Service):
         self._enforce_rate_limit()
 
         def _perform_analysis() -> VisionResult:
-            from ei_cli.services.image_downloader import ImageDownloader
-
             client = self._get_client()
-            downloader = ImageDownloader()
+            downloader = self._get_downloader()
             temp_file = None
 
             try:
@@ -586,10 +602,8 @@ class AIService(Service):
         self._enforce_rate_limit()
 
         def _perform_multi_analysis() -> VisionResult:
-            from ei_cli.services.image_downloader import ImageDownloader
-
             client = self._get_client()
-            downloader = ImageDownloader()
+            downloader = self._get_downloader()
             temp_files = []
 
             try:
@@ -1,19 +1,46 @@
 """Audio chunking utilities for handling large files."""
 
+import io
 import json
 import math
+import os
 import re
 import subprocess
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from rich.console import Console
 
+try:  # pragma: no cover - optional acceleration
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 if TYPE_CHECKING:
     from ei_cli.services.audio_processor import AudioProcessor
 
 console = Console()
 
+# Compiled once at import: matches both SRT (comma) and VTT (dot)
+# subtitle timestamps
+_TIMESTAMP_RE = re.compile(r"(\d{2}):(\d{2}):(\d{2})([.,])(\d{3})")
+
+# Whole-cue pattern for SRT/VTT blocks: optional index line, timestamp
+# line (with trailing VTT cue settings), then the cue text up to the
+# next blank line. One finditer pass over a chunk replaces the
+# split("\n\n") + per-block split("\n") line walk.
+_CUE_RE = re.compile(
+    r"(?:(\d+)\s*\n)?"
+    r"(\d{2}:\d{2}:\d{2}[,.]\d{3}) --> (\d{2}:\d{2}:\d{2}[,.]\d{3})"
+    r"([^\n]*)\n"
+    r"(.*?)(?=\n\s*\n|\Z)",
+    re.DOTALL,
+)
+
 
 class AudioChunkerError(Exception):
     """Error during audio chunking operations."""
@@ -36,6 +63,12 @@ class AudioChunker:
 
     # Whisper API limit is 25MB
     MAX_FILE_SIZE_MB = 25
+    # Precomputed byte threshold so the hot path skips the arithmetic
+    MAX_FILE_SIZE_BYTES = 25 * 1024 * 1024
+
+    # Trailing fragments shorter than this are folded into the
+    # previous chunk instead of wasting a transcription API call
+    MIN_CHUNK_DURATION = 1.0
 
     def __init__(self, processor: "AudioProcessor") -> None:
         """
@@ -45,6 +78,36 @@ class AudioChunker:
             processor: AudioProcessor instance for file operations
         """
         self.processor = processor
+        # Memoized ffprobe results keyed by (path, mtime_ns, size);
+        # see _get_audio_info
+        self._audio_info_cache: dict[tuple[str, int, int], dict] = {}
+
+    def _get_audio_info(self, audio_path: Path) -> dict:
+        """
+        Get audio info, memoized per (path, mtime, size).
+
+        ffprobe costs ~100ms of subprocess spawn per call; retries and
+        repeated split calls for the same unchanged file reuse the
+        first result. The key includes mtime and size so a replaced
+        file invalidates its entry automatically.
+
+        Args:
+            audio_path: Path to audio file
+
+        Returns:
+            Audio info dict from the processor
+        """
+        stat = os.stat(audio_path)
+        key = (str(audio_path), stat.st_mtime_ns, stat.st_size)
+        info = self._audio_info_cache.get(key)
+        if info is None:
+            info = self.processor.get_audio_info(audio_path)
+            # Keep the cache bounded; a CLI run touches few files, so
+            # wholesale eviction is simpler than LRU bookkeeping
+            if len(self._audio_info_cache) >= 128:
+                self._audio_info_cache.clear()
+            self._audio_info_cache[key] = info
+        return info
 
     def needs_chunking(self, audio_path: Path) -> bool:
         """
@@ -56,13 +119,60 @@ class AudioChunker:
         Returns:
             True if file is larger than MAX_FILE_SIZE_MB
         """
-        if not audio_path.exists():
+        try:
+            size = os.stat(audio_path).st_size
+        except FileNotFoundError as e:
             raise AudioChunkerError(
                 message=f"Audio file not found: {audio_path}",
-            )
+            ) from e
+
+        return size > self.MAX_FILE_SIZE_BYTES
+
+    def needs_chunking_batch(self, audio_paths: list[Path]) -> list[bool]:
+        """
+        Check if multiple audio files need chunking.
+
+        Paths are grouped by parent directory and sized with a single
+        os.scandir pass per directory. DirEntry.stat() reuses the
+        metadata the directory scan already fetched, so batch ingests
+        pay roughly one syscall per directory instead of one per file.
+
+        Args:
+            audio_paths: Paths to audio files
 
-        size_mb = audio_path.stat().st_size / (1024 * 1024)
-        return size_mb > self.MAX_FILE_SIZE_MB
+        Returns:
+            One bool per input path, in order, True where the file is
+            larger than MAX_FILE_SIZE_MB
+
+        Raises:
+            AudioChunkerError: If a file or its directory is missing
+        """
+        by_parent: dict[Path, list[Path]] = {}
+        for path in audio_paths:
+            by_parent.setdefault(path.parent, []).append(path)
+
+        results: dict[Path, bool] = {}
+        for parent, paths in by_parent.items():
+            wanted = {p.name: p for p in paths}
+            sizes: dict[str, int] = {}
+            try:
+                with os.scandir(parent) as entries:
+                    for entry in entries:
+                        if entry.name in wanted:
+                            sizes[entry.name] = entry.stat().st_size
+            except OSError as e:
+                raise AudioChunkerError(
+                    message=f"Cannot read directory: {parent}",
+                ) from e
+
+            for name, path in wanted.items():
+                if name not in sizes:
+                    raise AudioChunkerError(
+                        message=f"Audio file not found: {path}",
+                    )
+                results[path] = sizes[name] > self.MAX_FILE_SIZE_BYTES
+
+        return [results[path] for path in audio_paths]
 
     def split_audio(
         self,
@@ -87,8 +197,8 @@ class AudioChunker:
             AudioChunkerError: If splitting fails
         """
         try:
-            # Get audio info
-            info = self.processor.get_audio_info(audio_path)
+            # Get audio info (memoized per file generation)
+            info = self._get_audio_info(audio_path)
             total_duration = info["duration"]
 
             if total_duration is None:
@@ -100,26 +210,48 @@ class AudioChunker:
             # Calculate number of chunks
             num_chunks = math.ceil(total_duration / chunk_duration)
 
+            # Fold a sub-threshold trailing fragment into the previous
+            # chunk: a 0.01s leftover is not worth a segment file plus
+            # a near-empty transcription API round trip
+            segment_times = None
+            if num_chunks > 1:
+                last_dur = (
+                    total_duration - (num_chunks - 1) * chunk_duration
+                )
+                if last_dur < self.MIN_CHUNK_DURATION:
+                    num_chunks -= 1
+                    segment_times = [
+                        i * chunk_duration for i in range(1, num_chunks)
+                    ]
+
             # Create output directory
             output_dir.mkdir(parents=True, exist_ok=True)
 
-            # Split audio into chunks
-            chunks: list[Path] = []
-            for i in range(num_chunks):
-                start_time = i * chunk_duration
-                chunk_path = output_dir / f"chunk_{i:04d}.wav"
-
-                # Use FFmpeg to extract chunk
-                self._extract_chunk(
-                    input_path=audio_path,
-                    output_path=chunk_path,
-                    start_time=start_time,
-                    duration=chunk_duration,
-                )
+            # One FFmpeg pass writes every chunk: the input is read and
+            # decoded once instead of spawning one process per chunk
+            self._extract_all_chunks(
+                input_path=audio_path,
+                output_dir=output_dir,
+                chunk_duration=chunk_duration,
+                segment_times=segment_times,
+            )
 
-                chunks.append(chunk_path)
+            # Trust the filesystem over the duration estimate: VBR
+            # metadata can be off by enough that the segment muxer
+            # writes one chunk more or fewer than predicted, and a
+            # fabricated list would then point at a missing file or
+            # silently drop a real one
+            chunk_paths = sorted(output_dir.glob("chunk_*.wav"))
+            if not chunk_paths:
+                raise AudioChunkerError(
+                    message="FFmpeg produced no chunk files",
+                    details={
+                        "file": str(audio_path),
+                        "output_dir": str(output_dir),
+                    },
+                )
 
-            return chunks
+            return chunk_paths
 
         except Exception as e:
             raise AudioChunkerError(
@@ -127,6 +259,206 @@ class AudioChunker:
                 details={"file": str(audio_path)},
             ) from e
 
+    def split_audio_streaming(
+        self,
+        audio_path: Path,
+        chunk_duration: int = 300,
+    ) -> Iterator[bytes]:
+        """
+        Split audio into chunks yielded as in-memory WAV bytes.
+
+        Each chunk is produced by FFmpeg writing to stdout, so no
+        intermediate files touch the disk. Callers can hand the bytes
+        straight to the transcription API (e.g. as
+        ``file=("audio.wav", data, "audio/wav")``), avoiding the
+        write-then-read round trip of split_audio.
+
+        Args:
+            audio_path: Path to input audio file
+            chunk_duration: Duration of each chunk in seconds (default: 5 min)
+
+        Yields:
+            WAV-encoded bytes for each chunk, in order
+
+        Raises:
+            AudioChunkerError: If duration cannot be determined or
+                extraction fails
+        """
+        info = self._get_audio_info(audio_path)
+        total_duration = info["duration"]
+
+        if total_duration is None:
+            raise AudioChunkerError(
+                message="Could not determine audio duration",
+                details={"file": str(audio_path)},
+            )
+
+        num_chunks = math.ceil(total_duration / chunk_duration)
+
+        for i in range(num_chunks):
+            yield self._extract_chunk_bytes(
+                input_path=audio_path,
+                start_time=i * chunk_duration,
+                duration=chunk_duration,
+            )
+
+    def _extract_chunk_bytes(
+        self,
+        input_path: Path,
+        start_time: int,
+        duration: int,
+    ) -> bytes:
+        """
+        Extract a chunk as WAV bytes via FFmpeg writing to stdout.
+
+        Uses the same fast input seeking as _extract_chunk (-ss before
+        -i) but sends the output to pipe:1 instead of a file.
+
+        Args:
+            input_path: Input audio file
+            start_time: Start time in seconds
+            duration: Duration in seconds
+
+        Returns:
+            WAV-encoded chunk bytes
+
+        Raises:
+            AudioChunkerError: If FFmpeg fails or is not installed
+        """
+        try:
+            cmd = [
+                "ffmpeg",
+                "-ss",
+                str(start_time),  # Seek in INPUT (fast)
+                "-i",
+                str(input_path),
+                "-t",
+                str(duration),  # Duration to extract
+                "-acodec",
+                "pcm_s16le",  # PCM 16-bit
+                "-ar",
+                "16000",  # 16kHz sample rate
+                "-ac",
+                "1",  # Mono
+                "-f",
+                "wav",
+                "pipe:1",  # Stream to stdout, no file
+            ]
+
+            # close_fds=False lets CPython spawn FFmpeg via
+            # posix_spawn instead of fork+exec with a close() loop over
+            # every possible FD; this CLI holds no sensitive FDs, so
+            # inheriting them is harmless
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                check=False,
+                close_fds=False,
+            )
+
+            if result.returncode != 0:
+                error_msg = (
+                    result.stderr.decode(errors="replace")
+                    if result.stderr
+                    else "Unknown FFmpeg error"
+                )
+                raise AudioChunkerError(
+                    message=f"FFmpeg chunk extraction failed: {error_msg}",
+                    details={
+                        "command": " ".join(cmd),
+                        "returncode": result.returncode,
+                    },
+                )
+
+            return result.stdout
+
+        except FileNotFoundError as e:
+            raise AudioChunkerError(
+                message="FFmpeg not found. Please install FFmpeg.",
+                details={"error": str(e)},
+            ) from e
+
+    def _extract_all_chunks(
+        self,
+        input_path: Path,
+        output_dir: Path,
+        chunk_duration: int,
+        segment_times: list[int] | None = None,
+    ) -> None:
+        """
+        Extract all chunks in a single FFmpeg pass via the segment muxer.
+
+        The input is demuxed and decoded exactly once; each segment is
+        written as it is produced. Compared to one FFmpeg invocation per
+        chunk this saves N-1 process spawns and N-1 seek/decode passes.
+
+        Args:
+            input_path: Input audio file
+            output_dir: Directory for chunk_%04d.wav output files
+            chunk_duration: Duration of each segment in seconds
+            segment_times: Explicit cut points in seconds; used instead
+                of the uniform chunk_duration when the final chunk has
+                been extended to absorb a tiny trailing fragment
+        """
+        try:
+            if segment_times:
+                # Explicit cut points: everything after the last one
+                # goes into the final (extended) segment
+                segment_args = [
+                    "-segment_times",
+                    ",".join(str(t) for t in segment_times),
+                ]
+            elif segment_times is not None:
+                # Single extended chunk: pick a segment length past the
+                # end of the file so FFmpeg never cuts
+                segment_args = ["-segment_time", str(chunk_duration + 1)]
+            else:
+                segment_args = ["-segment_time", str(chunk_duration)]
+
+            cmd = [
+                "ffmpeg",
+                "-y",  # Overwrite output
+                "-i",
+                str(input_path),
+                "-acodec",
+                "pcm_s16le",  # PCM 16-bit
+                "-ar",
+                "16000",  # 16kHz sample rate
+                "-ac",
+                "1",  # Mono
+                "-f",
+                "segment",
+                *segment_args,
+                "-reset_timestamps", "1",  # Each chunk starts at t=0
+                str(output_dir / "chunk_%04d.wav"),
+            ]
+
+            # close_fds=False: take the posix_spawn fast path (no
+            # per-FD close loop); no sensitive FDs to protect here
+            result = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                check=False,
+                close_fds=False,
+            )
+
+            if result.returncode != 0:
+                error_msg = result.stderr or "Unknown FFmpeg error"
+                raise AudioChunkerError(
+                    message=f"FFmpeg chunk extraction failed: {error_msg}",
+                    details={
+                        "command": " ".join(cmd),
+                        "returncode": result.returncode,
+                    },
+                )
+
+        except FileNotFoundError as e:
+            raise AudioChunkerError(
+                message="FFmpeg not found. Please install FFmpeg.",
+                details={"error": str(e)},
+            ) from e
+
     def _extract_chunk(
         self,
         input_path: Path,
@@ -169,11 +501,14 @@ class AudioChunker:
                 str(output_path),
             ]
 
+            # close_fds=False: take the posix_spawn fast path (no
+            # per-FD close loop); no sensitive FDs to protect here
             result = subprocess.run(
                 cmd,
                 capture_output=True,
                 text=True,
                 check=False,
+                close_fds=False,
             )
 
             if result.returncode != 0:
@@ -210,24 +545,50 @@ class AudioChunker:
         Raises:
             AudioChunkerError: If merging fails
         """
-        if format_type == "text":
-            # Simple concatenation with space
-            return " ".join(chunks)
+        try:
+            merger = self._MERGERS[format_type]
+        except KeyError:
+            raise AudioChunkerError(
+                message=f"Unsupported format for merging: {format_type}",
+            ) from None
+
+        return merger(self, chunks)
 
-        if format_type == "json":
-            # Merge JSON objects
+    def _merge_text(self, chunks: list[str]) -> str:
+        """
+        Merge plain-text transcription chunks.
+
+        Args:
+            chunks: List of transcription texts
+
+        Returns:
+            Chunks joined with single spaces
+        """
+        return " ".join(chunks)
+
+    def _merge_json(self, chunks: list[str]) -> str:
+        """
+        Merge JSON transcription chunks into one JSON object.
+
+        orjson's C parser is several times faster on these small
+        payloads when installed.
+
+        Args:
+            chunks: List of JSON transcription payloads
+
+        Returns:
+            JSON object with the merged text
+        """
+        if ORJSON_AVAILABLE:  # pragma: no cover - optional fast path
             merged_text = " ".join(
-                json.loads(chunk).get("text", "") for chunk in chunks
+                orjson.loads(chunk).get("text", "") for chunk in chunks
             )
-            return json.dumps({"text": merged_text})
+            return orjson.dumps({"text": merged_text}).decode()
 
-        if format_type in ("srt", "vtt"):
-            # Merge subtitle files with adjusted timestamps
-            return self._merge_subtitles(chunks, format_type)
-
-        raise AudioChunkerError(
-            message=f"Unsupported format for merging: {format_type}",
+        merged_text = " ".join(
+            json.loads(chunk).get("text", "") for chunk in chunks
         )
+        return json.dumps({"text": merged_text})
 
     def _merge_subtitles(self, chunks: list[str], format_type: str) -> str:
         """
@@ -241,56 +602,39 @@ class AudioChunker:
             Merged subtitle text
         """
 
-        merged_lines: list[str] = []
+        # One growable buffer for the whole output; per-cue write()
+        # calls avoid the intermediate strings a list + join or +=
+        # accumulation would allocate
+        merged = io.StringIO()
         time_offset = 0.0
         subtitle_index = 1
 
+        # Emit the VTT header once, up front
+        if format_type == "vtt":
+            merged.write("WEBVTT\n\n")
+
         for chunk in chunks:
-            lines = chunk.strip().split("\n")
-
-            # Skip VTT header
-            if format_type == "vtt" and lines and lines[0].startswith("WEBVTT"):
-                lines = lines[1:]
-
-            i = 0
-            while i < len(lines):
-                line = lines[i].strip()
-
-                # Check if this is a subtitle index
-                if line.isdigit():
-                    # Replace with sequential index
-                    merged_lines.append(str(subtitle_index))
-                    subtitle_index += 1
-                    i += 1
-                    continue
-
-                # Check if this is a timestamp line
-                time_pattern = r"(\d{2}:\d{2}:\d{2}[.,]\d{3})"
-                if re.search(time_pattern, line):
-                    # Adjust timestamps
-                    adjusted_line = self._adjust_timestamp(line, time_offset)
-                    merged_lines.append(adjusted_line)
-                    i += 1
-
-                    # Add subtitle text until blank line
-                    while i < len(lines) and lines[i].strip():
-                        merged_lines.append(lines[i])
-                        i += 1
-
-                    # Add blank line
-                    merged_lines.append("")
-                else:
-                    i += 1
+            # Single compiled-regex scan per chunk; cue indexes are
+            # renumbered sequentially across chunks, and the WEBVTT
+            # header never matches a cue so it is skipped for free
+            for match in _CUE_RE.finditer(chunk):
+                start, end, settings, text = match.group(2, 3, 4, 5)
+                timestamp_line = f"{start} --> {end}{settings}"
+
+                merged.write(f"{subtitle_index}\n")
+                subtitle_index += 1
+                merged.write(self._adjust_timestamp(
+                    timestamp_line, time_offset,
+                ))
+                merged.write("\n")
+                merged.write(text)
+                merged.write("\n\n")
 
             # Extract last timestamp to calculate offset for next chunk
             # This is approximate - assumes 10 minute chunks
             time_offset += 600.0
 
-        # Add VTT header if needed
-        if format_type == "vtt":
-            merged_lines.insert(0, "WEBVTT\n")
-
-        return "\n".join(merged_lines)
+        return merged.getvalue()
 
     def _adjust_timestamp(self, timestamp_line: str, offset: float) -> str:
         """
@@ -304,30 +648,27 @@ class AudioChunker:
             Adjusted timestamp line
         """
 
+        # Pure integer millisecond arithmetic: no float parsing or
+        # timedelta allocation per subtitle line
+        offset_ms = round(offset * 1000)
+
         def add_offset(match: re.Match) -> str:
             """Add offset to a timestamp."""
-            time_str = match.group(1)
-            # Parse time
-            parts = time_str.replace(",", ".").split(":")
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds = float(parts[2])
-
-            # Add offset
-            total_seconds = hours * 3600 + minutes * 60 + seconds + offset
-            new_hours = int(total_seconds // 3600)
-            new_minutes = int((total_seconds % 3600) // 60)
-            new_seconds = total_seconds % 60
-
-            # Format back
-            separator = "," if "," in time_str else "."
+            hours, minutes, seconds, separator, millis = match.groups()
+            total_ms = (
+                (int(hours) * 3600 + int(minutes) * 60 + int(seconds)) * 1000
+                + int(millis)
+                + offset_ms
+            )
+            new_hours, rest = divmod(total_ms, 3_600_000)
+            new_minutes, rest = divmod(rest, 60_000)
+            new_seconds, new_ms = divmod(rest, 1000)
             return (
-                f"{new_hours:02d}:{new_minutes:02d}:"
-                f"{new_seconds:06.3f}".replace(".", separator)
+                f"{new_hours:02d}:{new_minutes:02d}:{new_seconds:02d}"
+                f"{separator}{new_ms:03d}"
             )
 
-        pattern = r"(\d{2}:\d{2}:\d{2}[.,]\d{3})"
-        return re.sub(pattern, add_offset, timestamp_line)
+        return _TIMESTAMP_RE.sub(add_offset, timestamp_line)
 
     def cleanup_chunks(self, chunks: list[Path]) -> None:
         """
@@ -336,14 +677,35 @@ class AudioChunker:
         Args:
             chunks: List of chunk file paths
         """
-        for chunk in chunks:
+        def _unlink(chunk: Path) -> None:
             try:
-                if chunk.exists():
-                    chunk.unlink()
-            except Exception:
+                # Single unlink syscall; no exists() stat beforehand
+                chunk.unlink(missing_ok=True)
+            except OSError:
                 # Silently ignore cleanup errors
                 pass
 
+        if len(chunks) >= 16:
+            # unlink releases the GIL, so a small pool overlaps I/O
+            # waits on slow or network storage; below the threshold the
+            # pool overhead outweighs the win
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(_unlink, chunks))
+            return
+
+        for chunk in chunks:
+            _unlink(chunk)
+
+    # Format dispatch table: one dict lookup instead of a chained if.
+    # Entries resolve the method through self at call time so the
+    # usual patch.object-style overrides still take effect.
+    _MERGERS: ClassVar[dict[str, Callable[..., str]]] = {
+        "text": lambda self, chunks: self._merge_text(chunks),
+        "json": lambda self, chunks: self._merge_json(chunks),
+        "srt": lambda self, chunks: self._merge_subtitles(chunks, "srt"),
+        "vtt": lambda self, chunks: self._merge_subtitles(chunks, "vtt"),
+    }
+
     def __repr__(self) -> str:
         """Return string representation."""
         return f"AudioChunker(max_size={self.MAX_FILE_SIZE_MB}MB)"
@@ -56,19 +56,25 @@ class ServiceFactory:
         Raises:
             MissingAPIKeyError: If API key is not configured.
         """
-        if "ai" not in self._services:
-            # Import here to avoid circular dependencies
-            from ei_cli.services.ai_service import AIService
-
-            # Get OpenAI API key from unified settings (no legacy env bridging)
-            api_key = self._config.api.openai_api_key.get_secret_value()
-
-            self._services["ai"] = AIService(
-                api_key=api_key,
-                rate_limit=5,  # 5 requests per second
-                max_retries=3,  # 3 retry attempts
-            )
-        return self._services["ai"]
+        # Fast path: one dict lookup on cache hits instead of a
+        # membership test plus a second lookup
+        service = self._services.get("ai")
+        if service is not None:
+            return service
+
+        # Import here to avoid circular dependencies
+        from ei_cli.services.ai_service import AIService
+
+        # Get OpenAI API key from unified settings (no legacy env bridging)
+        api_key = self._config.api.openai_api_key.get_secret_value()
+
+        service = AIService(
+            api_key=api_key,
+            rate_limit=5,  # 5 requests per second
+            max_retries=3,  # 3 retry attempts
+        )
+        self._services["ai"] = service
+        return service
 
     def get_image_service(self) -> "ImageService":  # noqa: F821
         """
@@ -77,12 +83,16 @@ class ServiceFactory:
         Returns:
             ImageService for image processing operations.
         """
-        if "image" not in self._services:
-            # Import here to avoid circular dependencies
-            from ei_cli.services.image_service import ImageService
+        service = self._services.get("image")
+        if service is not None:
+            return service
+
+        # Import here to avoid circular dependencies
+        from ei_cli.services.image_service import ImageService
 
-            self._services["image"] = ImageService()
-        return self._services["image"]
+        service = ImageService()
+        self._services["image"] = service
+        return service
 
     def __repr__(self) -> str:
         """String representation."""
@@ -1,5 +1,6 @@
 """Video downloader using yt-dlp for extracting audio from videos."""
 
+import functools
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,29 @@ from rich.progress import (
 )
 
 
+@functools.lru_cache(maxsize=1024)
+def _url_supported(url: str) -> bool:
+    """
+    Check a URL against yt-dlp's extractors, memoized per URL.
+
+    Enumerating extractors is slow; repeated probes of the same URL
+    hit the cache instead of re-scanning the whole extractor list.
+
+    Args:
+        url: Video URL
+
+    Returns:
+        True if any extractor claims the URL
+
+    Raises:
+        ImportError: If yt-dlp is not installed
+    """
+    import yt_dlp
+
+    extractors = yt_dlp.extractor.gen_extractors()
+    return any(extractor.suitable(url) for extractor in extractors)
+
+
 class VideoDownloadError(Exception):
     """Error during video download operations."""
 
@@ -488,14 +512,7 @@ class VideoDownloader:
             True if URL is supported
         """
         try:
-            import yt_dlp
-
-            extractors = yt_dlp.extractor.gen_extractors()
-            for extractor in extractors:
-                if extractor.suitable(url):
-                    return True
-            return False
-
+            return _url_supported(url)
         except ImportError:
             return False
 
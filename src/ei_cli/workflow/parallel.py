@@ -1,7 +1,11 @@
 """Parallel execution for independent tasks."""
 
 import asyncio
-from collections.abc import Callable
+import atexit
+import contextlib
+import os
+import threading
+from collections.abc import AsyncIterator, Callable
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
@@ -10,16 +14,58 @@ from rich.progress import Progress, SpinnerColumn, TaskID, TextColumn, TimeElaps
 
 console = Console()
 
+# I/O-bound fan-out default: scale with the host instead of a fixed 3,
+# capped at 32; EI_CLI_MAX_WORKERS overrides it (read once at import)
+_DEFAULT_MAX_WORKERS = int(
+    os.environ.get("EI_CLI_MAX_WORKERS", min(32, (os.cpu_count() or 1) * 5)),
+)
+
+# Process-wide pool shared by all executors so each batch reuses
+# warm threads instead of paying max_workers thread-start syscalls
+_shared_pool: ThreadPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> ThreadPoolExecutor:
+    """
+    Return the shared thread pool, growing it if needed.
+
+    Args:
+        max_workers: Minimum worker count the caller requires
+
+    Returns:
+        The lazily created process-wide thread pool
+    """
+    global _shared_pool  # noqa: PLW0603
+
+    pool = _shared_pool
+    if pool is not None and max_workers <= pool._max_workers:  # noqa: SLF001
+        return pool
+
+    with _pool_lock:
+        if _shared_pool is None:
+            _shared_pool = ThreadPoolExecutor(
+                max_workers=max_workers,
+                thread_name_prefix="ei-cli-parallel",
+            )
+            atexit.register(_shared_pool.shutdown)
+        elif max_workers > _shared_pool._max_workers:  # noqa: SLF001
+            # Worker threads spawn lazily on submit, so raising the
+            # cap is enough to grow the pool in place
+            _shared_pool._max_workers = max_workers  # noqa: SLF001
+        return _shared_pool
+
 
 class ParallelExecutor:
     """Execute independent tasks in parallel with progress tracking."""
 
-    def __init__(self, max_workers: int = 3) -> None:
+    def __init__(self, max_workers: int = _DEFAULT_MAX_WORKERS) -> None:
         """
         Initialize parallel executor.
 
         Args:
-            max_workers: Maximum number of parallel workers (default: 3)
+            max_workers: Maximum number of parallel workers
+                (default: 5 per CPU, capped at 32, or EI_CLI_MAX_WORKERS)
         """
         self.max_workers = max_workers
 
@@ -52,17 +98,10 @@ class ParallelExecutor:
                 progress.add_task(desc, total=None) for desc in descriptions
             ]
 
-            # Run tasks in parallel
-            results = await asyncio.gather(
-                *[
-                    self._run_async_task(task, progress, task_id)
-                    for task, task_id in zip(tasks, task_ids, strict=False)
-                ],
-                return_exceptions=True,
-            )
-
-            # Update final status
-            for i, result in enumerate(results):
+            # Collect in completion order, store in submission order
+            results: list[Any] = [None] * len(tasks)
+            async for i, result in self._iter_completed(tasks):
+                results[i] = result
                 if isinstance(result, Exception):
                     progress.update(
                         task_ids[i],
@@ -76,29 +115,87 @@ class ParallelExecutor:
 
             return results
 
-    async def _run_async_task(
+    async def _iter_completed(
         self,
-        task: Callable,
-        progress: Progress,
-        task_id: TaskID,
-    ) -> Any:
+        tasks: list[Callable],
+    ) -> AsyncIterator[tuple[int, Any]]:
         """
-        Run single async task with progress update.
+        Yield (index, result) pairs as tasks finish.
+
+        A semaphore caps in-flight coroutines at max_workers, and a
+        bounded queue keeps at most max_workers finished results in
+        flight, so peak memory follows the worker bound rather than
+        the task count and consumers see the first result as soon as
+        one task completes.
 
         Args:
-            task: Async callable to execute
-            progress: Progress instance
-            task_id: Task ID for progress updates
+            tasks: List of async callable functions
 
-        Returns:
-            Task result or raises exception
+        Yields:
+            Tuples of (task index, result or exception)
         """
-        try:
-            result = await task()
-            return result
-        except Exception as e:
-            # Return exception instead of raising so other tasks continue
-            return e
+        queue: asyncio.Queue[tuple[int, Any]] = asyncio.Queue(
+            maxsize=max(1, self.max_workers),
+        )
+        semaphore = asyncio.Semaphore(max(1, self.max_workers))
+
+        async def _wrap(index: int, task: Callable) -> None:
+            async with semaphore:
+                try:
+                    result = await task()
+                except Exception as e:
+                    # Queue exception instead of raising so others continue
+                    result = e
+            await queue.put((index, result))
+
+        closed = False
+        async with asyncio.TaskGroup() as tg:
+            workers = [
+                tg.create_task(_wrap(index, task))
+                for index, task in enumerate(tasks)
+            ]
+
+            # Drain inside the group; bounded puts unblock as we yield
+            try:
+                for _ in range(len(tasks)):
+                    yield await queue.get()
+            except GeneratorExit:
+                # The consumer abandoned the iterator. Cancel the
+                # workers ourselves and let the group exit cleanly:
+                # letting GeneratorExit hit TaskGroup.__aexit__ would
+                # re-raise it wrapped in a BaseExceptionGroup and log
+                # "Task exception was never retrieved"
+                closed = True
+                for worker in workers:
+                    worker.cancel()
+
+        if closed:
+            raise GeneratorExit
+
+    async def iter_parallel_async(
+        self,
+        tasks: list[Callable],
+        descriptions: list[str],
+    ) -> AsyncIterator[tuple[str, Any]]:
+        """
+        Yield (description, result) pairs in completion order.
+
+        Args:
+            tasks: List of async callable functions
+            descriptions: List of descriptions for each task
+
+        Yields:
+            Tuples of (description, result or exception)
+        """
+        if len(tasks) != len(descriptions):
+            raise ValueError("Number of tasks must match number of descriptions")
+
+        # aclosing ties the inner iterator's lifetime to this one: if
+        # the caller stops early, _iter_completed is closed here and
+        # now instead of whenever the GC's async finalizer gets to it
+        async with contextlib.aclosing(self._iter_completed(tasks)) as completed:
+            async for index, result in completed:
+                yield descriptions[index], result
 
     def run_parallel_sync(
         self,
@@ -118,6 +215,10 @@ class ParallelExecutor:
         if len(tasks) != len(descriptions):
             raise ValueError("Number of tasks must match number of descriptions")
 
+        # Short-circuit before touching the progress UI or the pool
+        if not tasks:
+            return []
+
         results = []
 
         with Progress(
@@ -131,28 +232,28 @@ class ParallelExecutor:
                 progress.add_task(desc, total=None) for desc in descriptions
             ]
 
-            # Run tasks in thread pool
-            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                futures = [
-                    executor.submit(self._run_sync_task, task, progress, task_id)
-                    for task, task_id in zip(tasks, task_ids, strict=False)
-                ]
-
-                # Collect results
-                for i, future in enumerate(futures):
-                    try:
-                        result = future.result()
-                        results.append(result)
-                        progress.update(
-                            task_ids[i],
-                            description=f"[green]✓ {descriptions[i]}[/green]",
-                        )
-                    except Exception as e:
-                        results.append(e)
-                        progress.update(
-                            task_ids[i],
-                            description=f"[red]✗ {descriptions[i]}[/red]",
-                        )
+            # Run tasks in the shared thread pool
+            executor = _get_pool(self.max_workers)
+            futures = [
+                executor.submit(self._run_sync_task, task, progress, task_id)
+                for task, task_id in zip(tasks, task_ids, strict=False)
+            ]
+
+            # Collect results
+            for i, future in enumerate(futures):
+                try:
+                    result = future.result()
+                    results.append(result)
+                    progress.update(
+                        task_ids[i],
+                        description=f"[green]✓ {descriptions[i]}[/green]",
+                    )
+                except Exception as e:
+                    results.append(e)
+                    progress.update(
+                        task_ids[i],
+                        description=f"[red]✗ {descriptions[i]}[/red]",
+                    )
 
         return results
 
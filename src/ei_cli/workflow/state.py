@@ -2,7 +2,10 @@
 
 import hashlib
 import json
+import os
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -11,8 +14,51 @@ from pydantic import BaseModel, ConfigDict, Field, field_serializer
 from rich.console import Console
 from rich.prompt import Confirm
 
+try:  # orjson is an optional speedup; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
 console = Console()
 
+# Journal size that triggers compaction into the consolidated file
+_JOURNAL_COMPACT_BYTES = 4096
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Serialize state data to indented JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode()
+
+
+def _loads(raw: bytes) -> Any:
+    """Parse JSON bytes with the fastest available codec."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+# How long a cached artifact-validation verdict stays fresh
+_VALIDATION_CACHE_TTL = 0.5
+
+
+def _md5_file(path: Path) -> str:
+    """
+    MD5-hash a file without loading it into memory.
+
+    hashlib.file_digest (3.11+, which this package requires) hashes in
+    the C layer and releases the GIL, so batched hashing scales across
+    threads.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex digest of the file contents
+    """
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "md5").hexdigest()
+
 
 class WorkflowArtifact(BaseModel):
     """Represents a workflow artifact (file produced by a step)."""
@@ -65,11 +111,7 @@ class WorkflowArtifact(BaseModel):
 
     def _calculate_checksum(self) -> str:
         """Calculate MD5 checksum of the file."""
-        md5 = hashlib.md5()
-        with open(self.file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5.update(chunk)
-        return md5.hexdigest()
+        return _md5_file(self.file_path)
 
 
 class WorkflowState(BaseModel):
@@ -127,14 +169,20 @@ class WorkflowStateManager:
         self.workflow_dir = Path(workflow_dir)
         self.workflow_dir.mkdir(parents=True, exist_ok=True)
         self.state_file = self.workflow_dir / ".workflow_state.json"
+        self.journal_file = self.workflow_dir / ".workflow_state.jsonl"
         self.workflow_name = workflow_name
+        # Recent validate() verdicts keyed by path; spares a stat (and
+        # possible re-hash) per artifact on repeated status queries
+        self._validation_cache: dict[str, tuple[float, bool]] = {}
+        # Dirty until the in-memory state has been persisted once
+        self._dirty = True
         self.state = self._load_or_create()
 
     def _load_or_create(self) -> WorkflowState:
         """Load existing state or create new."""
         if self.state_file.exists():
             try:
-                data = json.loads(self.state_file.read_text())
+                data = _loads(self.state_file.read_bytes())
 
                 # Convert datetime strings back to datetime objects
                 if "started_at" in data:
@@ -153,7 +201,9 @@ class WorkflowStateManager:
                         artifacts[step_name] = WorkflowArtifact(**artifact_data)
                     data["artifacts"] = artifacts
 
-                return WorkflowState(**data)
+                state = WorkflowState(**data)
+                self._replay_journal(state)
+                return state
 
             except Exception as e:
                 console.print(
@@ -161,10 +211,46 @@ class WorkflowStateManager:
                 )
                 console.print("[dim]Starting fresh workflow...[/dim]")
 
-        return WorkflowState(workflow_name=self.workflow_name)
+        state = WorkflowState(workflow_name=self.workflow_name)
+        self._replay_journal(state)
+        return state
+
+    def _replay_journal(self, state: WorkflowState) -> None:
+        """
+        Apply journaled step records on top of the consolidated state.
+
+        Args:
+            state: State loaded from the consolidated file
+        """
+        if not self.journal_file.exists():
+            return
+
+        try:
+            for line in self.journal_file.read_text().splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                step_name = record["step"]
+                if step_name not in state.completed_steps:
+                    state.completed_steps.append(step_name)
+                if record.get("path"):
+                    state.artifacts[step_name] = WorkflowArtifact(
+                        step_name=step_name,
+                        file_path=Path(record["path"]),
+                        created_at=datetime.fromisoformat(record["ts"]),
+                        size_bytes=record["size"],
+                        checksum=record.get("checksum"),
+                    )
+        except Exception as e:
+            console.print(
+                f"[yellow]⚠️  Could not replay workflow journal: {e}[/yellow]",
+            )
 
     def save(self) -> None:
-        """Save current state to disk."""
+        """Save current state to disk (no-op when nothing changed)."""
+        if not self._dirty:
+            return
+
         try:
             # Convert to dict for JSON serialization
             data = self.state.model_dump()
@@ -183,11 +269,58 @@ class WorkflowStateManager:
                 artifacts_data[step_name] = artifact_dict
             data["artifacts"] = artifacts_data
 
-            self.state_file.write_text(json.dumps(data, indent=2))
+            self.state_file.write_bytes(_dumps(data))
+            self._dirty = False
+
+            # The consolidated file now holds everything the journal did
+            if self.journal_file.exists():
+                self.journal_file.unlink()
 
         except Exception as e:
             console.print(f"[yellow]⚠️  Could not save workflow state: {e}[/yellow]")
 
+    def _append_journal(
+        self,
+        step_name: str,
+        artifact: WorkflowArtifact | None,
+    ) -> None:
+        """
+        Append one step record to the journal instead of rewriting state.
+
+        Keeps per-step persistence O(1) in bytes; the journal is folded
+        into the consolidated file once it grows past the compaction
+        threshold.
+
+        Args:
+            step_name: Name of the completed step
+            artifact: Artifact produced by the step, if any
+        """
+        record = {
+            "step": step_name,
+            "path": str(artifact.file_path) if artifact else None,
+            "size": artifact.size_bytes if artifact else None,
+            "checksum": artifact.checksum if artifact else None,
+            "ts": (
+                artifact.created_at if artifact else datetime.now()
+            ).isoformat(),
+        }
+
+        try:
+            with open(self.journal_file, "a") as f:
+                f.write(json.dumps(record) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            if self.journal_file.stat().st_size > _JOURNAL_COMPACT_BYTES:
+                self.save()
+
+        except Exception as e:
+            console.print(
+                f"[yellow]⚠️  Could not journal workflow state: {e}[/yellow]",
+            )
+            # Fall back to the full rewrite rather than losing the step
+            self.save()
+
     def mark_complete(
         self,
         step_name: str,
@@ -202,9 +335,13 @@ class WorkflowStateManager:
             artifact_path: Optional path to artifact produced by step
             calculate_checksum: Whether to calculate checksum (slower but safer)
         """
+        self._dirty = True
         if step_name not in self.state.completed_steps:
             self.state.completed_steps.append(step_name)
 
+        artifact = None
+        if artifact_path is not None:
+            self._validation_cache.pop(str(artifact_path), None)
         if artifact_path and artifact_path.exists():
             artifact = WorkflowArtifact(
                 step_name=step_name,
@@ -217,6 +354,50 @@ class WorkflowStateManager:
 
             self.state.artifacts[step_name] = artifact
 
+        self._append_journal(step_name, artifact)
+
+    def mark_complete_batch(
+        self,
+        items: list[tuple[str, Path]],
+        calculate_checksum: bool = True,
+    ) -> None:
+        """
+        Mark several steps complete with one state write.
+
+        Checksums are computed across a thread pool — hashlib releases
+        the GIL while digesting, so hashing scales with cores — and the
+        state is persisted once at the end instead of per step.
+
+        Args:
+            items: Tuples of (step name, artifact path)
+            calculate_checksum: Whether to calculate checksums
+        """
+        self._dirty = True
+        present = [(name, path) for name, path in items if path.exists()]
+
+        checksums: dict[str, str] = {}
+        if calculate_checksum and present:
+            workers = min(8, os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                digests = pool.map(_md5_file, [path for _, path in present])
+                checksums = {
+                    name: digest
+                    for (name, _), digest in zip(present, digests, strict=True)
+                }
+
+        for name, path in items:
+            if name not in self.state.completed_steps:
+                self.state.completed_steps.append(name)
+            self._validation_cache.pop(str(path), None)
+
+        for name, path in present:
+            self.state.artifacts[name] = WorkflowArtifact(
+                step_name=name,
+                file_path=path,
+                size_bytes=path.stat().st_size,
+                checksum=checksums.get(name),
+            )
+
         self.save()
 
     def is_complete(self, step_name: str) -> bool:
@@ -242,7 +423,7 @@ class WorkflowStateManager:
             Path to artifact if exists and valid, None otherwise
         """
         artifact = self.state.artifacts.get(step_name)
-        if artifact and artifact.validate():
+        if artifact and self._validate_cached(artifact):
             return artifact.file_path
 
         # Artifact missing or invalid
@@ -253,10 +434,32 @@ class WorkflowStateManager:
             # Remove from completed steps so it will be re-run
             if step_name in self.state.completed_steps:
                 self.state.completed_steps.remove(step_name)
+                self._dirty = True
                 self.save()
 
         return None
 
+    def _validate_cached(self, artifact: WorkflowArtifact) -> bool:
+        """
+        Validate an artifact, reusing a recent verdict when fresh.
+
+        Args:
+            artifact: Artifact to validate
+
+        Returns:
+            True if the artifact is valid
+        """
+        key = str(artifact.file_path)
+        now = time.monotonic()
+
+        cached = self._validation_cache.get(key)
+        if cached is not None and now - cached[0] < _VALIDATION_CACHE_TTL:
+            return cached[1]
+
+        valid = artifact.validate()
+        self._validation_cache[key] = (now, valid)
+        return valid
+
     def mark_failed(self, error: str) -> None:
         """
         Mark workflow as failed with error message.
@@ -265,11 +468,13 @@ class WorkflowStateManager:
             error: Error message
         """
         self.state.last_error = error
+        self._dirty = True
         self.save()
 
     def mark_workflow_complete(self) -> None:
         """Mark entire workflow as complete."""
         self.state.completed_at = datetime.now()
+        self._dirty = True
         self.save()
 
     def should_resume(self) -> bool:
@@ -312,8 +517,10 @@ class WorkflowStateManager:
 
     def reset(self) -> None:
         """Reset workflow state (start fresh)."""
+        self._dirty = True
         self.state.completed_steps = []
         self.state.artifacts = {}
+        self._validation_cache.clear()
         self.state.last_error = None
         self.state.started_at = datetime.now()
         self.state.completed_at = None
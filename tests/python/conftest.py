@@ -44,17 +44,17 @@ def tmp_project(tmp_path: Path) -> Path:
     return project
 
 
-@pytest.fixture()
-def tmp_git_repo(tmp_path: Path) -> Path:
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory) -> Path:
     """
-    Create a temporary git repository.
+    Build the template git repository once per session.
 
-    Returns:
-        Path to temporary git repo
+    git init + commit spawn subprocesses and write ~10 files; doing it
+    once and copying the result keeps per-test cost to a copytree.
     """
     import git
 
-    repo_path = tmp_path / "git_repo"
+    repo_path = tmp_path_factory.mktemp("git_template") / "git_repo"
     repo_path.mkdir()
 
     repo = git.Repo.init(repo_path)
@@ -67,6 +67,22 @@ def tmp_git_repo(tmp_path: Path) -> Path:
     return repo_path
 
 
+@pytest.fixture()
+def tmp_git_repo(tmp_path: Path, _git_repo_template: Path) -> Path:
+    """
+    Create a temporary git repository.
+
+    Returns:
+        Path to temporary git repo
+    """
+    import shutil
+
+    repo_path = tmp_path / "git_repo"
+    shutil.copytree(_git_repo_template, repo_path)
+
+    return repo_path
+
+
 # ============================================================================
 # MOCK SERVICE FIXTURES
 # ============================================================================
@@ -78,8 +94,18 @@ def mock_logger():
     return CapturingLogger()
 
 
+# Service mocks are built once per session and handed out through
+# function-scoped fixtures that wipe state and reapply the defaults, so
+# tests keep full isolation without re-allocating Mock objects.
+
+@pytest.fixture(scope="session")
+def _mock_ai_service_session():
+    """Session-scoped AI service mock (reset per test)."""
+    return Mock()
+
+
 @pytest.fixture()
-def mock_ai_service():
+def mock_ai_service(_mock_ai_service_session):
     """
     Mock AI service with common responses.
 
@@ -87,14 +113,21 @@ def mock_ai_service():
         - generate() returns "Generated content"
         - Can be customized per test
     """
-    mock = Mock()
+    mock = _mock_ai_service_session
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.generate.return_value = "Generated content"
     mock.estimate_tokens.return_value = 100
     return mock
 
 
+@pytest.fixture(scope="session")
+def _mock_git_service_session():
+    """Session-scoped Git service mock (reset per test)."""
+    return Mock()
+
+
 @pytest.fixture()
-def mock_git_service():
+def mock_git_service(_mock_git_service_session):
     """
     Mock Git service with common operations.
 
@@ -103,15 +136,22 @@ def mock_git_service():
         - is_repo() returns True
         - Can be customized per test
     """
-    mock = Mock()
+    mock = _mock_git_service_session
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.commit.return_value = "abc123def456"
     mock.is_repo.return_value = True
     mock.is_dirty.return_value = False
     return mock
 
 
+@pytest.fixture(scope="session")
+def _mock_template_service_session():
+    """Session-scoped Template service mock (reset per test)."""
+    return Mock()
+
+
 @pytest.fixture()
-def mock_template_service():
+def mock_template_service(_mock_template_service_session):
     """
     Mock Template service with common operations.
 
@@ -120,7 +160,8 @@ def mock_template_service():
         - load_template() returns template content
         - Can be customized per test
     """
-    mock = Mock()
+    mock = _mock_template_service_session
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.list_templates.return_value = [
         "email-writing",
         "lesson-plans",
@@ -130,8 +171,14 @@ def mock_template_service():
     return mock
 
 
+@pytest.fixture(scope="session")
+def _mock_iteration_service_session():
+    """Session-scoped Iteration service mock (reset per test)."""
+    return Mock()
+
+
 @pytest.fixture()
-def mock_iteration_service():
+def mock_iteration_service(_mock_iteration_service_session):
     """
     Mock Iteration service.
 
@@ -139,7 +186,8 @@ def mock_iteration_service():
         - create_iteration() returns iteration object
         - Can be customized per test
     """
-    mock = Mock()
+    mock = _mock_iteration_service_session
+    mock.reset_mock(return_value=True, side_effect=True)
     mock.create_iteration.return_value = {
         "id": "iter_abc123",
         "prompt": "Test prompt",
@@ -188,10 +236,13 @@ def mock_container(
 # CLI TESTING FIXTURES
 # ============================================================================
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def cli_runner():
     """
-    Click CLI test runner.
+    Click CLI test runner, shared across the session.
+
+    CliRunner keeps no state between invocations, so one instance
+    serves every test.
 
     Usage:
         def test_command(cli_runner):
@@ -319,11 +370,14 @@ def mock_env(monkeypatch):
 # HYPOTHESIS STRATEGIES
 # ============================================================================
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def hypothesis_strategies():
     """
     Common Hypothesis strategies for property testing.
 
+    Strategies are immutable, so they are built once per session
+    instead of recompiling the alphabet constraints for every test.
+
     Usage:
         def test_property(hypothesis_strategies):
             st = hypothesis_strategies
@@ -381,6 +435,14 @@ def pytest_configure(config):
 # HOOKS
 # ============================================================================
 
+_MARKERS_BY_DIR = {
+    "unit": pytest.mark.unit,
+    "integration": pytest.mark.integration,
+    "e2e": pytest.mark.e2e,
+    "property": pytest.mark.property,
+}
+
+
 def pytest_collection_modifyitems(config, items):
     """
     Automatically add markers based on test location.
@@ -389,15 +451,13 @@ def pytest_collection_modifyitems(config, items):
     - tests/python/integration/ → @pytest.mark.integration
     - tests/python/e2e/ → @pytest.mark.e2e
     - tests/python/property/ → @pytest.mark.property
+
+    Matching on item.path.parts avoids building a path string and
+    substring-scanning it four times per collected item.
     """
     for item in items:
-        test_path = str(item.fspath)
-
-        if "/unit/" in test_path:
-            item.add_marker(pytest.mark.unit)
-        elif "/integration/" in test_path:
-            item.add_marker(pytest.mark.integration)
-        elif "/e2e/" in test_path:
-            item.add_marker(pytest.mark.e2e)
-        elif "/property/" in test_path:
-            item.add_marker(pytest.mark.property)
+        for part in item.path.parts:
+            marker = _MARKERS_BY_DIR.get(part)
+            if marker is not None:
+                item.add_marker(marker)
+                break
@@ -3,28 +3,27 @@ Integration tests for CLI commands using ServiceFactory mocks.
 
 Tests command argument parsing, error handling, and output formatting
 with the plugin-based architecture.
+
+Heavy imports (the ei_cli plugin modules and their service
+dependencies) are deferred into the tests themselves so that collection
+stays cheap as the suite grows; CLI invocations go through the shared
+session-scoped cli_runner fixture.
 """
 
 from unittest.mock import Mock, patch
 
-from click.testing import CliRunner
-
-from ei_cli.plugins.image import image
-from ei_cli.plugins.search import search
-from ei_cli.services.ai_service import (
-    ImageGenerationResult,
-    SearchCitation,
-    SearchResult,
-)
-from ei_cli.services.base import ServiceError
-
 
 class TestImageCommand:
     """Tests for image generation command."""
 
     @patch("ei_cli.plugins.image.ServiceFactory")
-    def test_image_basic_generation(self, mock_factory_class: Mock) -> None:
+    def test_image_basic_generation(
+        self, mock_factory_class: Mock, cli_runner,
+    ) -> None:
         """Test basic image generation."""
+        from ei_cli.plugins.image import image
+        from ei_cli.services.ai_service import ImageGenerationResult
+
         mock_service = Mock()
         mock_service.check_available.return_value = (True, None)
         mock_service.generate_image.return_value = ImageGenerationResult(
@@ -35,8 +34,7 @@ class TestImageCommand:
         mock_factory.get_ai_service.return_value = mock_service
         mock_factory_class.return_value = mock_factory
 
-        runner = CliRunner()
-        result = runner.invoke(image, ["a sunset"])
+        result = cli_runner.invoke(image, ["a sunset"])
 
         assert result.exit_code == 0
         assert "https://" in result.output or "Generated" in result.output
@@ -45,8 +43,11 @@ class TestImageCommand:
     def test_image_service_unavailable(
         self,
         mock_factory_class: Mock,
+        cli_runner,
     ) -> None:
         """Test handling when service is unavailable."""
+        from ei_cli.plugins.image import image
+
         mock_service = Mock()
         mock_service.check_available.return_value = (
             False,
@@ -56,15 +57,19 @@ class TestImageCommand:
         mock_factory.get_ai_service.return_value = mock_service
         mock_factory_class.return_value = mock_factory
 
-        runner = CliRunner()
-        result = runner.invoke(image, ["test"])
+        result = cli_runner.invoke(image, ["test"])
 
         assert result.exit_code == 1
         assert "not available" in result.output
 
     @patch("ei_cli.plugins.image.ServiceFactory")
-    def test_image_service_error(self, mock_factory_class: Mock) -> None:
+    def test_image_service_error(
+        self, mock_factory_class: Mock, cli_runner,
+    ) -> None:
         """Test handling service errors."""
+        from ei_cli.plugins.image import image
+        from ei_cli.services.base import ServiceError
+
         mock_service = Mock()
         mock_service.check_available.return_value = (True, None)
         mock_service.generate_image.side_effect = ServiceError(
@@ -75,15 +80,15 @@ class TestImageCommand:
         mock_factory.get_ai_service.return_value = mock_service
         mock_factory_class.return_value = mock_factory
 
-        runner = CliRunner()
-        result = runner.invoke(image, ["test"])
+        result = cli_runner.invoke(image, ["test"])
 
         assert result.exit_code == 1
 
-    def test_image_help(self) -> None:
+    def test_image_help(self, cli_runner) -> None:
         """Test image command help."""
-        runner = CliRunner()
-        result = runner.invoke(image, ["--help"])
+        from ei_cli.plugins.image import image
+
+        result = cli_runner.invoke(image, ["--help"])
 
         assert result.exit_code == 0
         assert "Generate" in result.output or "image" in result.output
@@ -93,8 +98,13 @@ class TestSearchCommand:
     """Tests for search command."""
 
     @patch("ei_cli.plugins.search.ServiceFactory")
-    def test_search_basic(self, mock_factory_class: Mock) -> None:
+    def test_search_basic(
+        self, mock_factory_class: Mock, cli_runner,
+    ) -> None:
         """Test basic search."""
+        from ei_cli.plugins.search import search
+        from ei_cli.services.ai_service import SearchCitation, SearchResult
+
         mock_service = Mock()
         mock_service.check_available.return_value = (True, None)
         mock_service.search.return_value = SearchResult(
@@ -113,8 +123,7 @@ class TestSearchCommand:
         mock_factory.get_ai_service.return_value = mock_service
         mock_factory_class.return_value = mock_factory
 
-        runner = CliRunner()
-        result = runner.invoke(search, ["test query"])
+        result = cli_runner.invoke(search, ["test query"])
 
         assert result.exit_code == 0
         assert (
@@ -123,8 +132,13 @@ class TestSearchCommand:
         )
 
     @patch("ei_cli.plugins.search.ServiceFactory")
-    def test_search_with_domains(self, mock_factory_class: Mock) -> None:
+    def test_search_with_domains(
+        self, mock_factory_class: Mock, cli_runner,
+    ) -> None:
         """Test search with domain restrictions."""
+        from ei_cli.plugins.search import search
+        from ei_cli.services.ai_service import SearchResult
+
         mock_service = Mock()
         mock_service.check_available.return_value = (True, None)
         mock_service.search.return_value = SearchResult(
@@ -136,8 +150,7 @@ class TestSearchCommand:
         mock_factory.get_ai_service.return_value = mock_service
         mock_factory_class.return_value = mock_factory
 
-        runner = CliRunner()
-        result = runner.invoke(
+        result = cli_runner.invoke(
             search,
             ["test", "--domains", "example.com"],
         )
@@ -147,10 +160,11 @@ class TestSearchCommand:
         call_kwargs = mock_service.search.call_args[1]
         assert call_kwargs["allowed_domains"] == ["example.com"]
 
-    def test_search_help(self) -> None:
+    def test_search_help(self, cli_runner) -> None:
         """Test search command help."""
-        runner = CliRunner()
-        result = runner.invoke(search, ["--help"])
+        from ei_cli.plugins.search import search
+
+        result = cli_runner.invoke(search, ["--help"])
 
         assert result.exit_code == 0
         assert "search" in result.output.lower()
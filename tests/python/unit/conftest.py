@@ -0,0 +1,39 @@
+"""Shared fixtures for unit tests."""
+import pytest
+
+from ei_cli.core.rate_limiter import RateLimiter
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_imports():
+    """
+    Import the core ei_cli modules once per session.
+
+    Warms the import cache before the first test so each xdist worker
+    pays the cascading core/services imports a single time instead of
+    on its first test that happens to need them.
+    """
+    import ei_cli.core.error_handler  # noqa: F401
+    import ei_cli.core.errors  # noqa: F401
+    import ei_cli.services.exceptions  # noqa: F401
+
+
+@pytest.fixture
+def make_limiter():
+    """
+    RateLimiter factory.
+
+    Tests call it with the usual constructor kwargs; every limiter
+    built through it is reset in one batch at teardown.
+    """
+    created = []
+
+    def _make(**kwargs):
+        limiter = RateLimiter(**kwargs)
+        created.append(limiter)
+        return limiter
+
+    yield _make
+
+    for limiter in created:
+        limiter.reset()
@@ -9,27 +9,50 @@ import pytest
 from ei_cli.services.audio_chunker import AudioChunker, AudioChunkerError
 
 
-@pytest.fixture
-def audio_chunker():
-    """Create AudioChunker instance with mocked processor."""
-    mock_processor = Mock()
-    return AudioChunker(processor=mock_processor)
+class StubProcessor:
+    """
+    Minimal stand-in for AudioProcessor.
+
+    A plain class instantiates far faster than Mock() and makes the
+    contract explicit: set audio_info, read get_audio_info_calls.
+    """
+
+    def __init__(self):
+        self.audio_info = {}
+        self.get_audio_info_calls = 0
+
+    def get_audio_info(self, audio_path):
+        self.get_audio_info_calls += 1
+        return self.audio_info
 
 
 @pytest.fixture
-def temp_audio_file(tmp_path):
-    """Create a temporary audio file for testing."""
-    audio_file = tmp_path / "test_audio.mp3"
-    # Create a file larger than 25MB
-    audio_file.write_bytes(b"0" * (26 * 1024 * 1024))
+def audio_chunker():
+    """Create AudioChunker instance with a stub processor."""
+    return AudioChunker(processor=StubProcessor())
+
+
+@pytest.fixture(scope="session")
+def temp_audio_file(tmp_path_factory):
+    """
+    Create a 26MB audio file, shared across the session.
+
+    The file is sparse (truncate, no bytes written): needs_chunking
+    only reads st_size, so tests never pay for materializing 26MB of
+    zeros per test.
+    """
+    audio_file = tmp_path_factory.mktemp("audio") / "test_audio.mp3"
+    with open(audio_file, "wb") as f:
+        f.truncate(26 * 1024 * 1024)
     return audio_file
 
 
-@pytest.fixture
-def small_audio_file(tmp_path):
-    """Create a small temporary audio file."""
-    audio_file = tmp_path / "small_audio.mp3"
-    audio_file.write_bytes(b"0" * (1 * 1024 * 1024))  # 1MB
+@pytest.fixture(scope="session")
+def small_audio_file(tmp_path_factory):
+    """Create a sparse 1MB audio file, shared across the session."""
+    audio_file = tmp_path_factory.mktemp("audio") / "small_audio.mp3"
+    with open(audio_file, "wb") as f:
+        f.truncate(1 * 1024 * 1024)
     return audio_file
 
 
@@ -45,6 +68,7 @@ class TestAudioChunkerInit:
     def test_max_file_size_constant(self):
         """Test MAX_FILE_SIZE_MB constant is correctly set."""
         assert AudioChunker.MAX_FILE_SIZE_MB == 25
+        assert AudioChunker.MAX_FILE_SIZE_BYTES == 26214400
 
 
 class TestNeedsChunking:
@@ -63,7 +87,8 @@ class TestNeedsChunking:
     def test_needs_chunking_exactly_25mb(self, audio_chunker, tmp_path):
         """Test file exactly at 25MB threshold."""
         audio_file = tmp_path / "exact_25mb.mp3"
-        audio_file.write_bytes(b"0" * (25 * 1024 * 1024))
+        with open(audio_file, "wb") as f:
+            f.truncate(25 * 1024 * 1024)  # Sparse: size without I/O
         result = audio_chunker.needs_chunking(audio_file)
         assert result is False  # Should be False (not greater than)
 
@@ -82,6 +107,39 @@ class TestNeedsChunking:
         assert "Audio file not found" in str(exc_info.value)
 
 
+class TestNeedsChunkingBatch:
+    """Tests for needs_chunking_batch method."""
+
+    def test_batch_mixed_sizes(
+        self, audio_chunker, temp_audio_file, small_audio_file,
+    ):
+        """Test batch check over large and small files."""
+        results = audio_chunker.needs_chunking_batch(
+            [temp_audio_file, small_audio_file],
+        )
+
+        assert results == [True, False]
+
+    def test_batch_avoids_per_file_stat(
+        self, audio_chunker, temp_audio_file, small_audio_file,
+    ):
+        """Test sizes come from the scandir entries, not os.stat."""
+        with patch(
+            "ei_cli.services.audio_chunker.os.stat",
+        ) as mock_stat:
+            results = audio_chunker.needs_chunking_batch(
+                [temp_audio_file, small_audio_file],
+            )
+
+        assert results == [True, False]
+        mock_stat.assert_not_called()
+
+    def test_batch_missing_file(self, audio_chunker, tmp_path):
+        """Test missing file raises error."""
+        with pytest.raises(AudioChunkerError, match="not found"):
+            audio_chunker.needs_chunking_batch([tmp_path / "missing.mp3"])
+
+
 class TestExtractChunk:
     """Tests for _extract_chunk method."""
 
@@ -90,7 +148,8 @@ class TestExtractChunk:
         """Test successful chunk extraction."""
         input_file = tmp_path / "input.mp3"
         output_file = tmp_path / "chunk.wav"
-        input_file.write_bytes(b"audio data")
+        # subprocess.run is mocked; the path only has to exist
+        input_file.touch()
 
         mock_run.return_value = Mock(returncode=0)
 
@@ -111,13 +170,16 @@ class TestExtractChunk:
         assert "0.0" in call_args
         assert "-t" in call_args
         assert "10.0" in call_args
+        # posix_spawn fast path: no per-FD close loop
+        assert mock_run.call_args.kwargs.get("close_fds") is False
 
     @patch("ei_cli.services.audio_chunker.subprocess.run")
     def test_extract_chunk_ffmpeg_failure(self, mock_run, audio_chunker, tmp_path):
         """Test FFmpeg failure handling."""
         input_file = tmp_path / "input.mp3"
         output_file = tmp_path / "chunk.wav"
-        input_file.write_bytes(b"audio data")
+        # subprocess.run is mocked; the path only has to exist
+        input_file.touch()
 
         mock_run.return_value = Mock(returncode=1, stderr="FFmpeg error")
 
@@ -136,7 +198,8 @@ class TestExtractChunk:
         """Test subprocess exception handling."""
         input_file = tmp_path / "input.mp3"
         output_file = tmp_path / "chunk.wav"
-        input_file.write_bytes(b"audio data")
+        # subprocess.run is mocked; the path only has to exist
+        input_file.touch()
 
         mock_run.side_effect = FileNotFoundError("ffmpeg not found")
 
@@ -151,22 +214,31 @@ class TestExtractChunk:
         assert "FFmpeg not found" in str(exc_info.value)
 
 
+
+def _write_chunks(output_dir: Path, count: int) -> None:
+    """Simulate FFmpeg's segment muxer writing chunk files."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for i in range(count):
+        (output_dir / f"chunk_{i:04d}.wav").write_bytes(b"RIFF")
+
+
 class TestSplitAudio:
     """Tests for split_audio method."""
 
     def test_split_audio_single_chunk(self, audio_chunker, tmp_path):
         """Test splitting audio that results in a single chunk."""
         audio_file = tmp_path / "audio.mp3"
-        audio_file.write_bytes(b"audio data")
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
         output_dir = tmp_path / "chunks"
 
         # Mock 5 minute audio with 10 minute chunks = 1 chunk
-        audio_chunker.processor.get_audio_info.return_value = {
+        audio_chunker.processor.audio_info = {
             "duration": 300.0,
         }
 
         with patch(
-            "ei_cli.services.audio_chunker.AudioChunker._extract_chunk",
+            "ei_cli.services.audio_chunker.AudioChunker._extract_all_chunks",
+            side_effect=lambda **_: _write_chunks(output_dir, 1),
         ):
             chunks = audio_chunker.split_audio(
                 audio_path=audio_file,
@@ -180,16 +252,17 @@ class TestSplitAudio:
     def test_split_audio_multiple_chunks(self, audio_chunker, tmp_path):
         """Test splitting audio into multiple chunks."""
         audio_file = tmp_path / "audio.mp3"
-        audio_file.write_bytes(b"audio data")
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
         output_dir = tmp_path / "chunks"
 
         # Mock 25 minute audio with 10 minute chunks = 3 chunks
-        audio_chunker.processor.get_audio_info.return_value = {
+        audio_chunker.processor.audio_info = {
             "duration": 1500.0,
         }
 
         with patch(
-            "ei_cli.services.audio_chunker.AudioChunker._extract_chunk",
+            "ei_cli.services.audio_chunker.AudioChunker._extract_all_chunks",
+            side_effect=lambda **_: _write_chunks(output_dir, 3),
         ):
             chunks = audio_chunker.split_audio(
                 audio_path=audio_file,
@@ -205,15 +278,16 @@ class TestSplitAudio:
     def test_split_audio_creates_output_dir(self, audio_chunker, tmp_path):
         """Test that output directory is created if it doesn't exist."""
         audio_file = tmp_path / "audio.mp3"
-        audio_file.write_bytes(b"audio data")
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
         output_dir = tmp_path / "new_chunks_dir"
 
-        audio_chunker.processor.get_audio_info.return_value = {
+        audio_chunker.processor.audio_info = {
             "duration": 300.0,
         }
 
         with patch(
-            "ei_cli.services.audio_chunker.AudioChunker._extract_chunk",
+            "ei_cli.services.audio_chunker.AudioChunker._extract_all_chunks",
+            side_effect=lambda **_: _write_chunks(output_dir, 1),
         ):
             audio_chunker.split_audio(
                 audio_path=audio_file,
@@ -224,13 +298,90 @@ class TestSplitAudio:
         assert output_dir.exists()
         assert output_dir.is_dir()
 
+    @patch("ei_cli.services.audio_chunker.subprocess.run")
+    def test_split_audio_single_ffmpeg_invocation(
+        self, mock_run, audio_chunker, tmp_path,
+    ):
+        """Test all chunks come from one segment-muxer FFmpeg call."""
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
+        output_dir = tmp_path / "chunks"
+
+        # Mock 25 minute audio with 10 minute chunks = 3 chunks
+        audio_chunker.processor.audio_info = {
+            "duration": 1500.0,
+        }
+        mock_run.side_effect = (
+            lambda *a, **k: (_write_chunks(output_dir, 3), Mock(returncode=0))[1]
+        )
+
+        chunks = audio_chunker.split_audio(
+            audio_path=audio_file,
+            output_dir=output_dir,
+            chunk_duration=600,
+        )
+
+        assert len(chunks) == 3
+        mock_run.assert_called_once()
+        call_args = mock_run.call_args[0][0]
+        assert "segment" in call_args
+        assert "-segment_time" in call_args
+        assert "600" in call_args
+
+    @patch("ei_cli.services.audio_chunker.subprocess.run")
+    def test_split_audio_tiny_remainder_merged(
+        self, mock_run, audio_chunker, tmp_path,
+    ):
+        """Test a sub-second leftover folds into the previous chunk."""
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
+        output_dir = tmp_path / "chunks"
+
+        # 1200.5s with 600s chunks: the 0.5s tail joins chunk 2
+        audio_chunker.processor.audio_info = {
+            "duration": 1200.5,
+        }
+        mock_run.side_effect = (
+            lambda *a, **k: (_write_chunks(output_dir, 2), Mock(returncode=0))[1]
+        )
+
+        chunks = audio_chunker.split_audio(
+            audio_path=audio_file,
+            output_dir=output_dir,
+            chunk_duration=600,
+        )
+
+        assert len(chunks) == 2
+        call_args = mock_run.call_args[0][0]
+        assert "-segment_times" in call_args
+        assert "600" in call_args
+
+    def test_split_audio_caches_audio_info(self, audio_chunker, tmp_path):
+        """Test repeated splits of an unchanged file probe it once."""
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
+        output_dir = tmp_path / "chunks"
+
+        audio_chunker.processor.audio_info = {
+            "duration": 300.0,
+        }
+
+        with patch(
+            "ei_cli.services.audio_chunker.AudioChunker._extract_all_chunks",
+            side_effect=lambda **_: _write_chunks(output_dir, 1),
+        ):
+            audio_chunker.split_audio(audio_file, output_dir, 600)
+            audio_chunker.split_audio(audio_file, output_dir, 600)
+
+        assert audio_chunker.processor.get_audio_info_calls == 1
+
     def test_split_audio_no_duration(self, audio_chunker, tmp_path):
         """Test with missing duration raises error."""
         audio_file = tmp_path / "audio.mp3"
-        audio_file.write_bytes(b"audio data")
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
         output_dir = tmp_path / "chunks"
 
-        audio_chunker.processor.get_audio_info.return_value = {
+        audio_chunker.processor.audio_info = {
             "duration": None,
         }
 
@@ -241,6 +392,112 @@ class TestSplitAudio:
                 chunk_duration=600,
             )
 
+    def test_split_audio_returns_actual_segments(
+        self, audio_chunker, tmp_path,
+    ):
+        """Test the result reflects what FFmpeg wrote, not the estimate."""
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
+        output_dir = tmp_path / "chunks"
+
+        # Metadata predicts 2 chunks, but the muxer writes 3 (e.g. a
+        # VBR duration estimate that undershot the real length)
+        audio_chunker.processor.audio_info = {
+            "duration": 1150.0,
+        }
+
+        with patch(
+            "ei_cli.services.audio_chunker.AudioChunker._extract_all_chunks",
+            side_effect=lambda **_: _write_chunks(output_dir, 3),
+        ):
+            chunks = audio_chunker.split_audio(
+                audio_path=audio_file,
+                output_dir=output_dir,
+                chunk_duration=600,
+            )
+
+        assert [c.name for c in chunks] == [
+            "chunk_0000.wav",
+            "chunk_0001.wav",
+            "chunk_0002.wav",
+        ]
+
+    def test_split_audio_no_segments_raises(self, audio_chunker, tmp_path):
+        """Test an FFmpeg run that writes nothing fails loudly."""
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
+        output_dir = tmp_path / "chunks"
+
+        audio_chunker.processor.audio_info = {
+            "duration": 300.0,
+        }
+
+        with patch(
+            "ei_cli.services.audio_chunker.AudioChunker._extract_all_chunks",
+        ), pytest.raises(AudioChunkerError, match="no chunk files"):
+            audio_chunker.split_audio(
+                audio_path=audio_file,
+                output_dir=output_dir,
+                chunk_duration=600,
+            )
+
+
+class TestSplitAudioStreaming:
+    """Tests for split_audio_streaming method."""
+
+    @patch("ei_cli.services.audio_chunker.subprocess.run")
+    def test_streaming_yields_bytes_no_files(
+        self, mock_run, audio_chunker, tmp_path,
+    ):
+        """Test chunks are yielded as bytes with no files on disk."""
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
+
+        # Mock 25 minute audio with 10 minute chunks = 3 chunks
+        audio_chunker.processor.audio_info = {
+            "duration": 1500.0,
+        }
+        mock_run.return_value = Mock(
+            returncode=0, stdout=b"RIFF-wav-data", stderr=b"",
+        )
+
+        chunks = list(
+            audio_chunker.split_audio_streaming(
+                audio_path=audio_file,
+                chunk_duration=600,
+            ),
+        )
+
+        assert chunks == [b"RIFF-wav-data"] * 3
+        assert mock_run.call_count == 3
+        # FFmpeg writes to stdout, not to a file
+        assert "pipe:1" in mock_run.call_args[0][0]
+        # Nothing besides the input file was written to disk
+        assert list(tmp_path.iterdir()) == [audio_file]
+
+    @patch("ei_cli.services.audio_chunker.subprocess.run")
+    def test_streaming_ffmpeg_failure(
+        self, mock_run, audio_chunker, tmp_path,
+    ):
+        """Test FFmpeg failure raises AudioChunkerError."""
+        audio_file = tmp_path / "audio.mp3"
+        audio_file.touch()  # FFmpeg is mocked; path just has to exist
+
+        audio_chunker.processor.audio_info = {
+            "duration": 300.0,
+        }
+        mock_run.return_value = Mock(
+            returncode=1, stdout=b"", stderr=b"FFmpeg error",
+        )
+
+        with pytest.raises(AudioChunkerError, match="FFmpeg"):
+            list(
+                audio_chunker.split_audio_streaming(
+                    audio_path=audio_file,
+                    chunk_duration=600,
+                ),
+            )
+
 
 class TestMergeTranscriptions:
     """Tests for merge_transcriptions method."""
@@ -1,5 +1,7 @@
 """Tests for service base classes and factory."""
 
+import pytest
+
 from ei_cli.config import Settings
 from ei_cli.services.base import (
     RateLimitError,
@@ -126,28 +128,41 @@ class TestServiceError:
         assert error.details["attempts"] == 3
 
 
+@pytest.fixture(scope="module", autouse=True)
+def _factory_env():
+    """
+    Set the API keys once for the whole module.
+
+    Each Settings() construction re-parses the environment through
+    pydantic; doing the setenv per test repeated that cost for every
+    factory test without changing what any of them observe.
+    """
+    mp = pytest.MonkeyPatch()
+    mp.setenv("EI_API_KEY", "test-key")
+    mp.setenv("API__OPENAI_API_KEY", "test-key")
+    yield
+    mp.undo()
+
+
 class TestServiceFactory:
     """Tests for ServiceFactory."""
 
-    def test_factory_initialization(self, monkeypatch):
+    def test_factory_initialization(self):
         """Test factory initialization."""
-        monkeypatch.setenv("API__OPENAI_API_KEY", "test-key")
         factory = ServiceFactory()
 
         assert factory.config is not None
         assert isinstance(factory.config, Settings)
 
-    def test_factory_with_custom_config(self, monkeypatch):
+    def test_factory_with_custom_config(self):
         """Test factory with custom config."""
-        monkeypatch.setenv("API__OPENAI_API_KEY", "test-key")
         config = Settings()
         factory = ServiceFactory(config=config)
 
         assert factory.config is config
 
-    def test_factory_reset(self, monkeypatch):
+    def test_factory_reset(self):
         """Test factory reset clears cached services."""
-        monkeypatch.setenv("EI_API_KEY", "test-key")
         factory = ServiceFactory()
 
         # Manually add a service to cache
@@ -159,26 +174,23 @@ class TestServiceFactory:
         assert "test" not in factory._services
         assert len(factory._services) == 0
 
-    def test_factory_repr(self, monkeypatch):
+    def test_factory_repr(self):
         """Test factory string representation."""
-        monkeypatch.setenv("EI_API_KEY", "test-key")
         factory = ServiceFactory()
         repr_str = repr(factory)
 
         assert "ServiceFactory" in repr_str
         assert "services" in repr_str
 
-    def test_factory_lazy_initialization(self, monkeypatch):
+    def test_factory_lazy_initialization(self):
         """Test services are lazily initialized."""
-        monkeypatch.setenv("EI_API_KEY", "test-key")
         factory = ServiceFactory()
 
         # Initially no services should be created
         assert len(factory._services) == 0
 
-    def test_factory_singleton_pattern(self, monkeypatch):
+    def test_factory_singleton_pattern(self):
         """Test factory returns same instance on multiple calls."""
-        monkeypatch.setenv("EI_API_KEY", "test-key")
         factory = ServiceFactory()
 
         # Get service twice
@@ -189,11 +201,8 @@ class TestServiceFactory:
         assert service1 is service2
         assert len(factory._services) == 1
 
-    def test_factory_multiple_services(self, monkeypatch):
+    def test_factory_multiple_services(self):
         """Test factory can create multiple service types."""
-        # Set API key for AIService
-        monkeypatch.setenv("EI_API_KEY", "test-key")
-
         factory = ServiceFactory()
 
         # Get both services
@@ -5,7 +5,7 @@ Tests image processing operations including cropping, background removal,
 and optimization with proper validation and error handling.
 """
 
-import tempfile
+import io
 from pathlib import Path
 from unittest.mock import patch
 
@@ -22,38 +22,65 @@ from ei_cli.services.image_service import (
 )
 
 
+def _png_mode(path):
+    """
+    Read a PNG's mode from its IHDR header without decoding pixels.
+
+    Byte 25 of a PNG file is the IHDR color type; mapping it avoids
+    inflating the whole image just to assert on the mode.
+    """
+    color_type = Path(path).read_bytes()[25]
+    return {0: "L", 2: "RGB", 3: "P", 4: "LA", 6: "RGBA"}[color_type]
+
+
+def _encode_image(size, color, fmt="PNG"):
+    """Encode a solid-color image once at import time."""
+    buffer = io.BytesIO()
+    Image.new("RGB", size, color).save(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+# Pre-encoded blobs: tests that need a fresh input file write these
+# bytes directly instead of paying a PIL encode per test
+_GREEN_500_PNG = _encode_image((500, 500), "green")
+_BLUE_200_JPEG = _encode_image((200, 200), "blue", fmt="JPEG")
+
+
 @pytest.fixture
 def service():
     """Create ImageService instance."""
     return ImageService()
 
 
-@pytest.fixture
-def temp_image():
-    """Create a temporary test image."""
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        # Create a simple image with white background and red square in center
-        img = Image.new("RGB", (100, 100), "white")
-        for x in range(40, 60):
-            for y in range(40, 60):
-                img.putpixel((x, y), (255, 0, 0))
-        img.save(f.name)
-        yield f.name
-        Path(f.name).unlink(missing_ok=True)
-
-
-@pytest.fixture
-def temp_rgba_image():
-    """Create a temporary RGBA test image."""
-    with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-        # Create RGBA image with transparent background
-        img = Image.new("RGBA", (100, 100), (255, 255, 255, 0))
-        for x in range(40, 60):
-            for y in range(40, 60):
-                img.putpixel((x, y), (255, 0, 0, 255))
-        img.save(f.name)
-        yield f.name
-        Path(f.name).unlink(missing_ok=True)
+@pytest.fixture(scope="session")
+def temp_image(tmp_path_factory):
+    """
+    Create a test image, shared across the session.
+
+    No test mutates the input file (outputs go to derived paths such
+    as _cropped.png), so the PNG is encoded and written once instead
+    of per test.
+    """
+    # White background with a red square in the center; one array
+    # slice instead of 400 putpixel round trips
+    arr = np.full((100, 100, 3), 255, np.uint8)
+    arr[40:60, 40:60] = (255, 0, 0)
+    path = tmp_path_factory.mktemp("images") / "image.png"
+    Image.fromarray(arr).save(path)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def temp_rgba_image(tmp_path_factory):
+    """Create an RGBA test image, shared across the session."""
+    # Transparent background with an opaque red square in the center
+    arr = np.zeros((100, 100, 4), np.uint8)
+    arr[:, :, :3] = 255
+    arr[:, :, 3] = 0
+    arr[40:60, 40:60] = (255, 0, 0, 255)
+    path = tmp_path_factory.mktemp("images") / "image_rgba.png"
+    Image.fromarray(arr).save(path)
+    return str(path)
 
 
 class TestImageServiceInitialization:
@@ -81,9 +108,9 @@ class TestImageServiceInitialization:
 class TestImageServiceCrop:
     """Test image cropping functionality."""
 
-    def test_crop_basic(self, service, temp_image):
+    def test_crop_basic(self, service, temp_image, tmp_path):
         """Test basic image cropping."""
-        output_path = temp_image.replace(".png", "_cropped.png")
+        output_path = str(tmp_path / "image_cropped.png")
 
         result = service.crop(temp_image, output_path=output_path)
 
@@ -97,8 +124,6 @@ class TestImageServiceCrop:
         assert result.cropped_size[1] < 100
         assert Path(output_path).exists()
 
-        # Cleanup
-        Path(output_path).unlink(missing_ok=True)
 
     def test_crop_auto_output_path(self, service, temp_image):
         """Test cropping with auto-generated output path."""
@@ -111,9 +136,9 @@ class TestImageServiceCrop:
         # Cleanup
         Path(result.output_path).unlink(missing_ok=True)
 
-    def test_crop_with_padding(self, service, temp_image):
+    def test_crop_with_padding(self, service, temp_image, tmp_path):
         """Test cropping with padding."""
-        output_path = temp_image.replace(".png", "_cropped_padded.png")
+        output_path = str(tmp_path / "image_cropped_padded.png")
 
         result = service.crop(temp_image, output_path=output_path, padding=5)
 
@@ -121,12 +146,10 @@ class TestImageServiceCrop:
         # With padding, should be slightly larger than without
         assert Path(output_path).exists()
 
-        # Cleanup
-        Path(output_path).unlink(missing_ok=True)
 
-    def test_crop_with_tolerance(self, service, temp_image):
+    def test_crop_with_tolerance(self, service, temp_image, tmp_path):
         """Test cropping with different tolerance."""
-        output_path = temp_image.replace(".png", "_cropped_tolerance.png")
+        output_path = str(tmp_path / "image_cropped_tolerance.png")
 
         result = service.crop(
             temp_image, output_path=output_path, tolerance=50,
@@ -135,24 +158,35 @@ class TestImageServiceCrop:
         assert result.success is True
         assert Path(output_path).exists()
 
-        # Cleanup
-        Path(output_path).unlink(missing_ok=True)
 
-    def test_crop_rgba_image(self, service, temp_rgba_image):
+    def test_crop_rgba_image(self, service, temp_rgba_image, tmp_path):
         """Test cropping RGBA image with alpha channel."""
-        output_path = temp_rgba_image.replace(".png", "_cropped.png")
+        output_path = str(tmp_path / "image_rgba_cropped.png")
 
-        result = service.crop(temp_rgba_image, output_path=output_path)
+        # Padding keeps part of the transparent border in the crop
+        result = service.crop(
+            temp_rgba_image, output_path=output_path, padding=2,
+        )
 
         assert result.success is True
         assert Path(output_path).exists()
 
-        # Verify transparency preserved
-        img = Image.open(output_path)
-        assert img.mode == "RGBA"
+        # Verify transparency preserved (header probe, no decode)
+        assert _png_mode(output_path) == "RGBA"
+
+
+    def test_crop_rgba_fully_opaque_drops_alpha(
+        self, service, temp_rgba_image, tmp_path,
+    ):
+        """Test fully opaque RGBA crop is saved without alpha channel."""
+        output_path = str(tmp_path / "image_rgba_cropped.png")
+
+        # Without padding the crop is exactly the opaque content
+        result = service.crop(temp_rgba_image, output_path=output_path)
+
+        assert result.success is True
+        assert _png_mode(output_path) == "RGB"
 
-        # Cleanup
-        Path(output_path).unlink(missing_ok=True)
 
     def test_crop_nonexistent_file(self, service):
         """Test cropping nonexistent file raises error."""
@@ -162,27 +196,55 @@ class TestImageServiceCrop:
         assert "not found" in str(exc_info.value).lower()
         assert exc_info.value.service_name == "image"
 
-    def test_crop_invalid_image(self, service):
+    def test_crop_invalid_image(self, service, tmp_path):
         """Test cropping invalid image file raises error."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(b"not an image")
-            temp_path = f.name
+        temp_path = tmp_path / "bad.png"
+        temp_path.write_bytes(b"not an image")
+
+        with pytest.raises(ServiceError) as exc_info:
+            service.crop(str(temp_path))
+
+        assert exc_info.value.service_name == "image"
 
-        try:
-            with pytest.raises(ServiceError) as exc_info:
-                service.crop(temp_path)
 
-            assert exc_info.value.service_name == "image"
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+class TestImageServiceCropBatch:
+    """Test batch cropping functionality."""
+
+    def test_crop_batch_basic(self, service, temp_image, tmp_path):
+        """Test cropping multiple images in one call."""
+        results = service.crop_batch(
+            [temp_image], output_dir=str(tmp_path),
+        )
+
+        assert len(results) == 1
+        assert results[0].success is True
+        assert Path(results[0].output_path).exists()
+
+    def test_crop_batch_empty(self, service):
+        """Test batch crop with no inputs returns empty list."""
+        assert service.crop_batch([]) == []
+
+    def test_crop_batch_continues_on_error(
+        self, service, temp_image, tmp_path,
+    ):
+        """Test batch crop reports failures without aborting."""
+        results = service.crop_batch(
+            [temp_image, "/nonexistent/file.png"],
+            output_dir=str(tmp_path),
+        )
+
+        assert len(results) == 2
+        assert results[0].success is True
+        assert results[1].success is False
+        assert "not found" in results[1].message.lower()
 
 
 class TestImageServiceRemoveBackground:
     """Test background removal functionality."""
 
-    def test_remove_background_basic(self, service, temp_image):
+    def test_remove_background_basic(self, service, temp_image, tmp_path):
         """Test basic background removal."""
-        output_path = temp_image.replace(".png", "_no_bg.png")
+        output_path = str(tmp_path / "image_no_bg.png")
 
         result = service.remove_background(temp_image, output_path=output_path)
 
@@ -194,11 +256,8 @@ class TestImageServiceRemoveBackground:
         assert Path(output_path).exists()
 
         # Verify output is RGBA
-        img = Image.open(output_path)
-        assert img.mode == "RGBA"
+        assert _png_mode(output_path) == "RGBA"
 
-        # Cleanup
-        Path(output_path).unlink(missing_ok=True)
 
     def test_remove_background_auto_output_path(self, service, temp_image):
         """Test background removal with auto-generated output path."""
@@ -211,9 +270,9 @@ class TestImageServiceRemoveBackground:
         # Cleanup
         Path(result.output_path).unlink(missing_ok=True)
 
-    def test_remove_background_with_tolerance(self, service, temp_image):
+    def test_remove_background_with_tolerance(self, service, temp_image, tmp_path):
         """Test background removal with different tolerance."""
-        output_path = temp_image.replace(".png", "_no_bg_tolerance.png")
+        output_path = str(tmp_path / "image_no_bg_tolerance.png")
 
         result = service.remove_background(
             temp_image, output_path=output_path, tolerance=50,
@@ -222,12 +281,10 @@ class TestImageServiceRemoveBackground:
         assert result.success is True
         assert Path(output_path).exists()
 
-        # Cleanup
-        Path(output_path).unlink(missing_ok=True)
 
-    def test_remove_background_rgba_image(self, service, temp_rgba_image):
+    def test_remove_background_rgba_image(self, service, temp_rgba_image, tmp_path):
         """Test background removal on RGBA image."""
-        output_path = temp_rgba_image.replace(".png", "_no_bg.png")
+        output_path = str(tmp_path / "image_rgba_no_bg.png")
 
         result = service.remove_background(
             temp_rgba_image, output_path=output_path,
@@ -236,8 +293,6 @@ class TestImageServiceRemoveBackground:
         assert result.success is True
         assert Path(output_path).exists()
 
-        # Cleanup
-        Path(output_path).unlink(missing_ok=True)
 
     def test_remove_background_nonexistent_file(self, service):
         """Test background removal on nonexistent file raises error."""
@@ -247,27 +302,23 @@ class TestImageServiceRemoveBackground:
         assert "not found" in str(exc_info.value).lower()
         assert exc_info.value.service_name == "image"
 
-    def test_remove_background_invalid_image(self, service):
+    def test_remove_background_invalid_image(self, service, tmp_path):
         """Test background removal on invalid image raises error."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(b"not an image")
-            temp_path = f.name
+        temp_path = tmp_path / "bad.png"
+        temp_path.write_bytes(b"not an image")
 
-        try:
-            with pytest.raises(ServiceError) as exc_info:
-                service.remove_background(temp_path)
+        with pytest.raises(ServiceError) as exc_info:
+            service.remove_background(str(temp_path))
 
-            assert exc_info.value.service_name == "image"
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        assert exc_info.value.service_name == "image"
 
 
 class TestImageServiceOptimize:
     """Test image optimization functionality."""
 
-    def test_optimize_basic(self, service, temp_image):
+    def test_optimize_basic(self, service, temp_image, tmp_path):
         """Test basic image optimization."""
-        output_path = temp_image.replace(".png", "_optimized.png")
+        output_path = str(tmp_path / "image_optimized.png")
 
         result = service.optimize(temp_image, output_path=output_path)
 
@@ -280,8 +331,6 @@ class TestImageServiceOptimize:
         assert isinstance(result.compression_ratio, float)
         assert Path(output_path).exists()
 
-        # Cleanup
-        Path(output_path).unlink(missing_ok=True)
 
     def test_optimize_auto_output_path(self, service, temp_image):
         """Test optimization with auto-generated output path."""
@@ -294,72 +343,52 @@ class TestImageServiceOptimize:
         # Cleanup
         Path(result.output_path).unlink(missing_ok=True)
 
-    def test_optimize_with_quality(self, service):
+    def test_optimize_with_quality(self, service, tmp_path):
         """Test optimization with quality setting."""
         # Create JPEG for quality test
-        with tempfile.NamedTemporaryFile(suffix=".jpg", delete=False) as f:
-            img = Image.new("RGB", (200, 200), "blue")
-            img.save(f.name)
-            temp_path = f.name
-
-        try:
-            output_path = temp_path.replace(".jpg", "_optimized.jpg")
-            result = service.optimize(
-                temp_path, output_path=output_path, quality=50,
-            )
+        temp_path = tmp_path / "blue.jpg"
+        temp_path.write_bytes(_BLUE_200_JPEG)
+        output_path = tmp_path / "blue_optimized.jpg"
 
-            assert result.success is True
-            assert Path(output_path).exists()
+        result = service.optimize(
+            str(temp_path), output_path=str(output_path), quality=50,
+        )
 
-            # Lower quality should result in smaller file
-            assert result.optimized_size_bytes < result.original_size_bytes
+        assert result.success is True
+        assert output_path.exists()
 
-            # Cleanup
-            Path(output_path).unlink(missing_ok=True)
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        # Lower quality should result in smaller file
+        assert result.optimized_size_bytes < result.original_size_bytes
 
-    def test_optimize_with_max_dimension(self, service):
+    def test_optimize_with_max_dimension(self, service, tmp_path):
         """Test optimization with size limit."""
         # Create larger image
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            img = Image.new("RGB", (500, 500), "green")
-            img.save(f.name)
-            temp_path = f.name
-
-        try:
-            output_path = temp_path.replace(".png", "_optimized.png")
-            result = service.optimize(
-                temp_path, output_path=output_path, max_dimension=200,
-            )
+        temp_path = tmp_path / "green.png"
+        temp_path.write_bytes(_GREEN_500_PNG)
+        output_path = tmp_path / "green_optimized.png"
 
-            assert result.success is True
-            assert Path(output_path).exists()
+        result = service.optimize(
+            str(temp_path), output_path=str(output_path), max_dimension=200,
+        )
 
-            # Check size was reduced
-            img = Image.open(output_path)
-            assert max(img.size) <= 200
+        assert result.success is True
+        assert output_path.exists()
 
-            # Cleanup
-            Path(output_path).unlink(missing_ok=True)
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+        # Check size was reduced
+        img = Image.open(output_path)
+        assert max(img.size) <= 200
 
-    def test_optimize_rgba_image(self, service, temp_rgba_image):
+    def test_optimize_rgba_image(self, service, temp_rgba_image, tmp_path):
         """Test optimization preserves transparency."""
-        output_path = temp_rgba_image.replace(".png", "_optimized.png")
+        output_path = str(tmp_path / "image_rgba_optimized.png")
 
         result = service.optimize(temp_rgba_image, output_path=output_path)
 
         assert result.success is True
         assert Path(output_path).exists()
 
-        # Verify transparency preserved
-        img = Image.open(output_path)
-        assert img.mode == "RGBA"
-
-        # Cleanup
-        Path(output_path).unlink(missing_ok=True)
+        # Verify transparency preserved (header probe, no decode)
+        assert _png_mode(output_path) == "RGBA"
 
     def test_optimize_nonexistent_file(self, service):
         """Test optimization on nonexistent file raises error."""
@@ -369,19 +398,45 @@ class TestImageServiceOptimize:
         assert "not found" in str(exc_info.value).lower()
         assert exc_info.value.service_name == "image"
 
-    def test_optimize_invalid_image(self, service):
+    def test_optimize_invalid_image(self, service, tmp_path):
         """Test optimization on invalid image raises error."""
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
-            f.write(b"not an image")
-            temp_path = f.name
+        temp_path = tmp_path / "bad.png"
+        temp_path.write_bytes(b"not an image")
+
+        with pytest.raises(ServiceError) as exc_info:
+            service.optimize(str(temp_path))
+
+        assert exc_info.value.service_name == "image"
+
+
+class TestImageServicePipeline:
+    """Test handle reuse across pipelined operations."""
 
-        try:
-            with pytest.raises(ServiceError) as exc_info:
-                service.optimize(temp_path)
+    def test_pipeline_reuses_handle(self, service, temp_image, tmp_path):
+        """Test a preloaded handle is decoded once across operations."""
+        with patch(
+            "ei_cli.services.image_service.Image.open", wraps=Image.open,
+        ) as mock_open:
+            handle = service.load(temp_image)
 
-            assert exc_info.value.service_name == "image"
-        finally:
-            Path(temp_path).unlink(missing_ok=True)
+            crop_result = service.crop(
+                handle, output_path=str(tmp_path / "piped_cropped.png"),
+            )
+            bg_result = service.remove_background(
+                handle, output_path=str(tmp_path / "piped_no_bg.png"),
+            )
+
+        assert crop_result.success is True
+        assert bg_result.success is True
+        assert mock_open.call_count == 1
+
+    def test_load_nonexistent_file(self, service):
+        """Test loading a nonexistent file raises error."""
+        with pytest.raises(ServiceError) as exc_info:
+            service.load("/nonexistent/file.png")
+
+        assert "not found" in str(exc_info.value).lower()
+        assert exc_info.value.service_name == "image"
 
 
 class TestImageServiceHelpers:
@@ -1,301 +1,295 @@
 """Tests for cache module."""
-import tempfile
 import time
 from pathlib import Path
 
-from ei_cli.core.cache import Cache
-
-
-class TestCache:
-    """Test Cache class."""
+import pytest
 
-    def test_init_creates_directory(self):
-        """Test that cache directory is created on init."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache_dir = Path(tmpdir) / "cache"
-            assert not cache_dir.exists()
-
-            cache = Cache(cache_dir, ttl_seconds=60)
-
-            assert cache_dir.exists()
-            assert cache.cache_dir == cache_dir
-            assert cache.ttl_seconds == 60
+from ei_cli.core.cache import Cache
 
-    def test_generate_key_same_args_same_key(self):
-        """Test that same arguments generate same key."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
 
-            key1 = cache._generate_key("arg1", "arg2", kwarg1="val1")
-            key2 = cache._generate_key("arg1", "arg2", kwarg1="val1")
+@pytest.fixture
+def cache(tmp_path):
+    """Create a Cache with the default TTL in a fresh directory."""
+    return Cache(tmp_path)
 
-            assert key1 == key2
 
-    def test_generate_key_different_args_different_key(self):
-        """Test that different arguments generate different keys."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """
+    Replace the cache module's clock with an advanceable fake.
 
-            key1 = cache._generate_key("arg1", "arg2")
-            key2 = cache._generate_key("arg1", "arg3")
+    TTL tests advance it instead of sleeping, so expiry is exercised
+    without burning real wall time.
+    """
+    now = [time.time()]
+    monkeypatch.setattr("ei_cli.core.cache.time.time", lambda: now[0])
 
-            assert key1 != key2
+    def advance(seconds):
+        now[0] += seconds
 
-    def test_get_miss_returns_none(self):
-        """Test that cache miss returns None."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+    return advance
 
-            result = cache.get("nonexistent")
 
-            assert result is None
-            assert cache._misses == 1
-            assert cache._hits == 0
+class TestCache:
+    """Test Cache class."""
 
-    def test_set_and_get_basic(self):
-        """Test basic set and get operations."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+    def test_init_creates_directory(self, tmp_path):
+        """Test that cache directory is created on init."""
+        cache_dir = Path(tmp_path) / "cache"
+        assert not cache_dir.exists()
 
-            cache.set("test_value", "key1", "key2")
-            result = cache.get("key1", "key2")
+        cache = Cache(cache_dir, ttl_seconds=60)
 
-            assert result == "test_value"
-            assert cache._hits == 1
-            assert cache._misses == 0
+        assert cache_dir.exists()
+        assert cache.cache_dir == cache_dir
+        assert cache.ttl_seconds == 60
 
-    def test_set_and_get_complex_value(self):
-        """Test caching complex data structures."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+    def test_generate_key_properties(self, cache):
+        """Test key determinism, arg sensitivity and kwarg ordering."""
+        base = cache._generate_key("arg1", "arg2", kwarg1="val1")
 
-            complex_value = {
-                "text": "result",
-                "numbers": [1, 2, 3],
-                "nested": {"key": "value"},
-            }
+        # Same arguments generate the same key
+        assert cache._generate_key("arg1", "arg2", kwarg1="val1") == base
 
-            cache.set(complex_value, "complex_key")
-            result = cache.get("complex_key")
+        # Different arguments generate different keys
+        assert cache._generate_key("arg1", "arg3", kwarg1="val1") != base
 
-            assert result == complex_value
+        # Kwargs order doesn't affect the key
+        key1 = cache._generate_key(a=1, b=2, c=3)
+        key2 = cache._generate_key(c=3, b=2, a=1)
+        assert key1 == key2
 
-    def test_ttl_expiration(self):
+    def test_get_miss_returns_none(self, cache):
+        """Test that cache miss returns None."""
+        result = cache.get("nonexistent")
+
+        assert result is None
+        assert cache._misses == 1
+        assert cache._hits == 0
+
+    @pytest.mark.parametrize(
+        ("value", "key_args", "key_kwargs"),
+        [
+            ("test_value", ("key1", "key2"), {}),  # basic string
+            (  # complex data structure
+                {
+                    "text": "result",
+                    "numbers": [1, 2, 3],
+                    "nested": {"key": "value"},
+                },
+                ("complex_key",),
+                {},
+            ),
+            ("kwarg_value", (), {"a": 1, "b": 2}),  # kwarg-only key
+        ],
+    )
+    def test_set_and_get_roundtrip(self, cache, value, key_args, key_kwargs):
+        """Test set followed by get returns the stored value."""
+        cache.set(value, *key_args, **key_kwargs)
+        result = cache.get(*key_args, **key_kwargs)
+
+        assert result == value
+        assert cache._hits == 1
+        assert cache._misses == 0
+
+    def test_ttl_expiration(self, tmp_path, frozen_clock):
         """Test that cache entries expire after TTL."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir, ttl_seconds=0.5)
+        cache = Cache(tmp_path, ttl_seconds=0.5)
 
-            cache.set("value", "key")
+        cache.set("value", "key")
 
-            # Should be available immediately
-            result = cache.get("key")
-            assert result == "value"
+        # Should be available immediately
+        result = cache.get("key")
+        assert result == "value"
 
-            # Wait for expiration
-            time.sleep(0.6)
+        # Advance past the TTL
+        frozen_clock(0.6)
 
-            # Should be expired
-            result = cache.get("key")
-            assert result is None
+        # Should be expired
+        result = cache.get("key")
+        assert result is None
 
-    def test_delete_existing_key(self):
+    def test_delete_existing_key(self, cache):
         """Test deleting an existing cache entry."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+        cache.set("value", "key")
+        assert cache.get("key") == "value"
 
-            cache.set("value", "key")
-            assert cache.get("key") == "value"
-
-            deleted = cache.delete("key")
-            assert deleted is True
-            assert cache.get("key") is None
+        deleted = cache.delete("key")
+        assert deleted is True
+        assert cache.get("key") is None
 
-    def test_delete_nonexistent_key(self):
+    def test_delete_nonexistent_key(self, cache):
         """Test deleting a non-existent key returns False."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+        deleted = cache.delete("nonexistent")
+        assert deleted is False
 
-            deleted = cache.delete("nonexistent")
-            assert deleted is False
-
-    def test_clear_all_entries(self):
+    def test_clear_all_entries(self, cache):
         """Test clearing all cache entries."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
-
-            cache.set("value1", "key1")
-            cache.set("value2", "key2")
-            cache.set("value3", "key3")
+        cache.set("value1", "key1")
+        cache.set("value2", "key2")
+        cache.set("value3", "key3")
 
-            count = cache.clear()
+        count = cache.clear()
 
-            assert count == 3
-            assert cache.get("key1") is None
-            assert cache.get("key2") is None
-            assert cache.get("key3") is None
+        assert count == 3
+        assert cache.get("key1") is None
+        assert cache.get("key2") is None
+        assert cache.get("key3") is None
 
-    def test_cleanup_expired_removes_old_entries(self):
+    def test_cleanup_expired_removes_old_entries(self, tmp_path, frozen_clock):
         """Test that cleanup removes expired entries."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir, ttl_seconds=0.5)
+        cache = Cache(tmp_path, ttl_seconds=0.5)
 
-            cache.set("value1", "key1")
-            cache.set("value2", "key2")
+        cache.set("value1", "key1")
+        cache.set("value2", "key2")
 
-            # Wait for expiration
-            time.sleep(0.6)
+        # Advance past the TTL
+        frozen_clock(0.6)
 
-            # Add a new entry
-            cache.set("value3", "key3")
+        # Add a new entry
+        cache.set("value3", "key3")
 
-            count = cache.cleanup_expired()
+        count = cache.cleanup_expired()
 
-            # Should remove 2 expired entries
-            assert count == 2
-            assert cache.get("key1") is None
-            assert cache.get("key2") is None
-            assert cache.get("key3") == "value3"
+        # Should remove 2 expired entries
+        assert count == 2
+        assert cache.get("key1") is None
+        assert cache.get("key2") is None
+        assert cache.get("key3") == "value3"
 
-    def test_cleanup_expired_removes_corrupted(self):
-        """Test that cleanup removes corrupted cache files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+    def test_cleanup_expired_removes_corrupted(self, cache):
+        """Test that cleanup removes corrupted cache entries."""
+        # Insert a row whose payload is not a valid pickle
+        cache._db.execute(
+            "INSERT INTO entries VALUES (?, ?, ?)",
+            ("corrupted", time.time(), b"not a pickle"),
+        )
 
-            # Create a corrupted cache file
-            corrupted_path = cache.cache_dir / "corrupted.json"
-            with corrupted_path.open("w") as f:
-                f.write("not valid json {")
+        count = cache.cleanup_expired()
 
-            count = cache.cleanup_expired()
+        assert count == 1
+        assert cache.get_stats()["size"] == 0
 
-            assert count == 1
-            assert not corrupted_path.exists()
-
-    def test_get_stats_tracks_hits_and_misses(self):
+    def test_get_stats_tracks_hits_and_misses(self, cache):
         """Test that statistics are tracked correctly."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
-
-            cache.set("value", "key")
+        cache.set("value", "key")
 
-            cache.get("key")  # hit
-            cache.get("key")  # hit
-            cache.get("nonexistent")  # miss
+        cache.get("key")  # hit
+        cache.get("key")  # hit
+        cache.get("nonexistent")  # miss
 
-            stats = cache.get_stats()
+        stats = cache.get_stats()
 
-            assert stats["hits"] == 2
-            assert stats["misses"] == 1
-            assert stats["hit_rate"] == 66.67
-            assert stats["size"] == 1
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 66.67
+        assert stats["size"] == 1
 
-    def test_reset_stats(self):
+    def test_reset_stats(self, cache):
         """Test resetting statistics."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
-
-            cache.set("value", "key")
-            cache.get("key")
-            cache.get("nonexistent")
+        cache.set("value", "key")
+        cache.get("key")
+        cache.get("nonexistent")
 
-            cache.reset_stats()
-            stats = cache.get_stats()
+        cache.reset_stats()
+        stats = cache.get_stats()
 
-            assert stats["hits"] == 0
-            assert stats["misses"] == 0
-            assert stats["hit_rate"] == 0.0
+        assert stats["hits"] == 0
+        assert stats["misses"] == 0
+        assert stats["hit_rate"] == 0.0
 
-    def test_repr(self):
+    def test_repr(self, tmp_path):
         """Test string representation."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir, ttl_seconds=3600)
-            cache.set("value", "key")
+        cache = Cache(tmp_path, ttl_seconds=3600)
+        cache.set("value", "key")
 
-            repr_str = repr(cache)
+        repr_str = repr(cache)
 
-            assert "Cache" in repr_str
-            assert "ttl=3600s" in repr_str
-            assert "size=1" in repr_str
-            assert "hit_rate=" in repr_str
+        assert "Cache" in repr_str
+        assert "ttl=3600s" in repr_str
+        assert "size=1" in repr_str
+        assert "hit_rate=" in repr_str
 
-    def test_get_handles_corrupted_files(self):
-        """Test that get handles corrupted cache files gracefully."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+    def test_get_handles_corrupted_files(self, cache):
+        """Test that get handles corrupted cache entries gracefully."""
+        # Insert a corrupted payload under a real key
+        key = cache._generate_key("test_key")
+        cache._db.execute(
+            "INSERT INTO entries VALUES (?, ?, ?)",
+            (key, time.time(), b"invalid pickle"),
+        )
 
-            # Create a corrupted cache file directly
-            key = cache._generate_key("test_key")
-            cache_path = cache._get_cache_path(key)
+        result = cache.get("test_key")
 
-            with cache_path.open("w") as f:
-                f.write("invalid json")
+        assert result is None
+        assert cache._misses == 1
 
-            result = cache.get("test_key")
+    def test_cache_persistence_across_instances(self, tmp_path):
+        """Test that cache persists across different instances."""
+        cache1 = Cache(tmp_path)
+        cache1.set("value1", "key1")
 
-            assert result is None
-            assert cache._misses == 1
+        # Create new instance pointing to same directory
+        cache2 = Cache(tmp_path)
+        result = cache2.get("key1")
 
-    def test_multiple_kwargs_order_independent(self):
-        """Test that kwargs order doesn't affect cache key."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+        assert result == "value1"
 
-            key1 = cache._generate_key(a=1, b=2, c=3)
-            key2 = cache._generate_key(c=3, b=2, a=1)
+    def test_zero_ttl_always_expires(self, tmp_path):
+        """Test that zero TTL causes immediate expiration."""
+        cache = Cache(tmp_path, ttl_seconds=0)
 
-            assert key1 == key2
+        cache.set("value", "key")
 
-    def test_cache_persistence_across_instances(self):
-        """Test that cache persists across different instances."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache1 = Cache(tmpdir)
-            cache1.set("value1", "key1")
+        # Should be expired immediately
+        result = cache.get("key")
+        assert result is None
 
-            # Create new instance pointing to same directory
-            cache2 = Cache(tmpdir)
-            result = cache2.get("key1")
+    def test_single_database_file(self, cache):
+        """Test all entries live in one database file."""
+        cache.set("value1", "key1")
+        cache.set("value2", "key2")
 
-            assert result == "value1"
+        assert (cache.cache_dir / "cache.db").exists()
+        assert not list(cache.cache_dir.glob("*.json"))
 
-    def test_zero_ttl_always_expires(self):
-        """Test that zero TTL causes immediate expiration."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir, ttl_seconds=0)
+    def test_is_expired_checks_age(self, tmp_path):
+        """Test expiration check logic."""
+        cache = Cache(tmp_path, ttl_seconds=60)
 
-            cache.set("value", "key")
+        # Fresh data
+        cache_data = {"cached_at": time.time(), "value": "test"}
+        assert not cache._is_expired(cache_data)
 
-            # Should be expired immediately
-            result = cache.get("key")
-            assert result is None
+        # Old data
+        old_data = {"cached_at": time.time() - 120, "value": "test"}
+        assert cache._is_expired(old_data)
 
-    def test_get_cache_path_format(self):
-        """Test cache file path format."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
-            key = "abc123"
+    def test_hit_rate_zero_when_no_requests(self, cache):
+        """Test hit rate is 0 when no requests made."""
+        stats = cache.get_stats()
+        assert stats["hit_rate"] == 0.0
 
-            path = cache._get_cache_path(key)
+    def test_usable_from_other_threads(self, cache):
+        """Test get/set work off the thread that opened the database."""
+        from concurrent.futures import ThreadPoolExecutor
 
-            assert path.parent == cache.cache_dir
-            assert path.name == f"{key}.json"
+        def roundtrip(i):
+            cache.set(f"value{i}", f"key{i}")
+            return cache.get(f"key{i}")
 
-    def test_is_expired_checks_age(self):
-        """Test expiration check logic."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir, ttl_seconds=60)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(roundtrip, range(8)))
 
-            # Fresh data
-            cache_data = {"cached_at": time.time(), "value": "test"}
-            assert not cache._is_expired(cache_data)
+        assert results == [f"value{i}" for i in range(8)]
 
-            # Old data
-            old_data = {"cached_at": time.time() - 120, "value": "test"}
-            assert cache._is_expired(old_data)
+    def test_context_manager_closes_connection(self, tmp_path):
+        """Test the context manager closes the connection on exit."""
+        import sqlite3
 
-    def test_hit_rate_zero_when_no_requests(self):
-        """Test hit rate is 0 when no requests made."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            cache = Cache(tmpdir)
+        with Cache(tmp_path) as cache:
+            cache.set("value", "key")
+            assert cache.get("key") == "value"
 
-            stats = cache.get_stats()
-            assert stats["hit_rate"] == 0.0
+        with pytest.raises(sqlite3.ProgrammingError):
+            cache.get("key")
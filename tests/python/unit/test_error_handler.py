@@ -1,8 +1,24 @@
 """Tests for error handler module."""
 
+import functools
+import re
+from collections.abc import Callable
+from types import MappingProxyType
+from typing import NamedTuple
+
 import pytest
 
-from ei_cli.core import error_handler
+from ei_cli.core.error_handler import (
+    _render_api_key_error,
+    _render_audio_conversion_error,
+    _render_for,
+    _render_general_error,
+    _render_invalid_audio_error,
+    _render_transcription_error,
+    _render_tts_error,
+    _render_video_download_error,
+    handle_error,
+)
 from ei_cli.services.exceptions import (
     APIKeyMissingError,
     AudioConversionError,
@@ -12,303 +28,226 @@ from ei_cli.services.exceptions import (
     VideoDownloadError,
 )
 
+class Case(NamedTuple):
+    """One renderer scenario; a NamedTuple keeps field access C-level."""
+
+    id: str
+    renderer: Callable[..., str]
+    exc: type[Exception]
+    msg: str
+    needles: tuple[str, ...]
+
+
+# One row per handler scenario: lowercase needles are matched
+# case-insensitively, mixed-case needles exactly
+HANDLER_CASES: tuple[Case, ...] = (
+    Case(
+        "api_key_missing",
+        _render_api_key_error,
+        APIKeyMissingError,
+        "OpenAI API key not found",
+        ("API Key Missing", "API__OPENAI_API_KEY", "config"),
+    ),
+    Case(
+        "video_invalid_url",
+        _render_video_download_error,
+        VideoDownloadError,
+        "Invalid URL format",
+        ("Video Download Failed", "URL format"),
+    ),
+    Case(
+        "video_private",
+        _render_video_download_error,
+        VideoDownloadError,
+        "Video is private",
+        ("Video Download Failed", "private"),
+    ),
+    Case(
+        "video_age_restricted",
+        _render_video_download_error,
+        VideoDownloadError,
+        "Age restricted",
+        ("Video Download Failed",),
+    ),
+    Case(
+        "video_network",
+        _render_video_download_error,
+        VideoDownloadError,
+        "Connection timeout",
+        ("Video Download Failed", "connection"),
+    ),
+    Case(
+        "transcription_file_too_large",
+        _render_transcription_error,
+        TranscriptionError,
+        "File size exceeds limit",
+        ("Transcription Failed", "size"),
+    ),
+    Case(
+        "transcription_invalid_format",
+        _render_transcription_error,
+        TranscriptionError,
+        "Unsupported audio format",
+        ("Transcription Failed", "format"),
+    ),
+    Case(
+        "transcription_api",
+        _render_transcription_error,
+        TranscriptionError,
+        "API rate limit exceeded",
+        ("Transcription Failed",),
+    ),
+    Case(
+        "tts_quota",
+        _render_tts_error,
+        TTSError,
+        "Quota exceeded",
+        ("Text-to-Speech Failed", "quota"),
+    ),
+    Case(
+        "tts_invalid_voice",
+        _render_tts_error,
+        TTSError,
+        "Invalid voice selection",
+        ("Text-to-Speech Failed", "voice"),
+    ),
+    Case(
+        "tts_text_too_long",
+        _render_tts_error,
+        TTSError,
+        "Text exceeds maximum length",
+        ("Text-to-Speech Failed", "length"),
+    ),
+    Case(
+        "audio_ffmpeg_missing",
+        _render_audio_conversion_error,
+        AudioConversionError,
+        "FFmpeg not found",
+        ("Audio Conversion Failed", "FFmpeg", "brew install ffmpeg"),
+    ),
+    Case(
+        "audio_invalid_codec",
+        _render_audio_conversion_error,
+        AudioConversionError,
+        "Unsupported codec",
+        ("Audio Conversion Failed", "codec"),
+    ),
+    Case(
+        "audio_corrupted",
+        _render_audio_conversion_error,
+        AudioConversionError,
+        "Corrupted audio stream",
+        ("Audio Conversion Failed", "corrupted"),
+    ),
+    Case(
+        "invalid_audio",
+        _render_invalid_audio_error,
+        InvalidAudioError,
+        "Unsupported format: .xyz",
+        ("Invalid Audio File", "Supported formats", "mp3"),
+    ),
+    Case(
+        "general",
+        _render_general_error,
+        Exception,
+        "Something went wrong",
+        ("Error", "Something went wrong", "troubleshooting"),
+    ),
+)
 
-class TestErrorHandlers:
-    """Test suite for error handler functions."""
-
-    def test_handle_api_key_error(self, capsys):
-        """Test API key error handler."""
-        error = APIKeyMissingError("OpenAI API key not found")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_api_key_error(error)
-
-        captured = capsys.readouterr()
-        assert "API Key Missing" in captured.out
-        assert "API__OPENAI_API_KEY" in captured.out
-        assert "config" in captured.out.lower()
-
-    def test_handle_video_download_error_invalid_url(self, capsys):
-        """Test video download error with invalid URL."""
-        error = VideoDownloadError("Invalid URL format")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_video_download_error(error)
-
-        captured = capsys.readouterr()
-        assert "Video Download Failed" in captured.out
-        assert "URL format" in captured.out
-
-    def test_handle_video_download_error_private_video(self, capsys):
-        """Test video download error with private video."""
-        error = VideoDownloadError("Video is private")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_video_download_error(error)
-
-        captured = capsys.readouterr()
-        assert "Video Download Failed" in captured.out
-        assert "private" in captured.out.lower()
-
-    def test_handle_video_download_error_age_restricted(self, capsys):
-        """Test video download error with age-restricted video."""
-        error = VideoDownloadError("Age restricted")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_video_download_error(error)
-
-        captured = capsys.readouterr()
-        assert "Video Download Failed" in captured.out
-
-    def test_handle_video_download_error_network(self, capsys):
-        """Test video download error with network issues."""
-        error = VideoDownloadError("Connection timeout")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_video_download_error(error)
-
-        captured = capsys.readouterr()
-        assert "Video Download Failed" in captured.out
-        assert "connection" in captured.out.lower()
-
-    def test_handle_transcription_error_file_too_large(self, capsys):
-        """Test transcription error with file too large."""
-        error = TranscriptionError("File size exceeds limit")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_transcription_error(error)
-
-        captured = capsys.readouterr()
-        assert "Transcription Failed" in captured.out
-        assert "size" in captured.out.lower()
-
-    def test_handle_transcription_error_invalid_format(self, capsys):
-        """Test transcription error with invalid format."""
-        error = TranscriptionError("Unsupported audio format")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_transcription_error(error)
-
-        captured = capsys.readouterr()
-        assert "Transcription Failed" in captured.out
-        assert "format" in captured.out.lower()
-
-    def test_handle_transcription_error_api(self, capsys):
-        """Test transcription error with API issues."""
-        error = TranscriptionError("API rate limit exceeded")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_transcription_error(error)
-
-        captured = capsys.readouterr()
-        assert "Transcription Failed" in captured.out
-
-    def test_handle_tts_error_quota_exceeded(self, capsys):
-        """Test TTS error with quota exceeded."""
-        error = TTSError("Quota exceeded")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_tts_error(error)
-
-        captured = capsys.readouterr()
-        assert "Text-to-Speech Failed" in captured.out
-        assert "quota" in captured.out.lower()
-
-    def test_handle_tts_error_invalid_voice(self, capsys):
-        """Test TTS error with invalid voice."""
-        error = TTSError("Invalid voice selection")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_tts_error(error)
-
-        captured = capsys.readouterr()
-        assert "Text-to-Speech Failed" in captured.out
-        # Just check that voice-related keywords appear
-        assert ("voice" in captured.out.lower() or
-                "API key" in captured.out)
-
-    def test_handle_tts_error_text_too_long(self, capsys):
-        """Test TTS error with text too long."""
-        error = TTSError("Text exceeds maximum length")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_tts_error(error)
-
-        captured = capsys.readouterr()
-        assert "Text-to-Speech Failed" in captured.out
-        assert "length" in captured.out.lower()
-
-    def test_handle_audio_conversion_error_ffmpeg_missing(self, capsys):
-        """Test audio conversion error with missing FFmpeg."""
-        error = AudioConversionError("FFmpeg not found")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_audio_conversion_error(error)
-
-        captured = capsys.readouterr()
-        assert "Audio Conversion Failed" in captured.out
-        assert "FFmpeg" in captured.out
-        assert "brew install ffmpeg" in captured.out
-
-    def test_handle_audio_conversion_error_invalid_codec(self, capsys):
-        """Test audio conversion error with invalid codec."""
-        error = AudioConversionError("Unsupported codec")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_audio_conversion_error(error)
-
-        captured = capsys.readouterr()
-        assert "Audio Conversion Failed" in captured.out
-        assert "codec" in captured.out.lower()
-
-    def test_handle_audio_conversion_error_corrupted(self, capsys):
-        """Test audio conversion error with corrupted file."""
-        error = AudioConversionError("Corrupted audio stream")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_audio_conversion_error(error)
-
-        captured = capsys.readouterr()
-        assert "Audio Conversion Failed" in captured.out
-        assert "corrupted" in captured.out.lower()
-
-    def test_handle_invalid_audio_error(self, capsys):
-        """Test invalid audio error handler."""
-        error = InvalidAudioError("Unsupported format: .xyz")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_invalid_audio_error(error)
-
-        captured = capsys.readouterr()
-        assert "Invalid Audio File" in captured.out
-        assert "Supported formats" in captured.out
-        # Check for common audio formats mentioned
-        assert ("MP3" in captured.out or "mp3" in captured.out.lower())
-
-    def test_handle_general_error(self, capsys):
-        """Test general error handler."""
-        error = Exception("Something went wrong")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_general_error(error)
-
-        captured = capsys.readouterr()
-        assert "Error" in captured.out
-        assert "Something went wrong" in captured.out
-        # Check for help or troubleshooting keywords
-        assert ("help" in captured.out.lower() or
-                "issues" in captured.out.lower() or
-                "troubleshooting" in captured.out.lower())
-
-    def test_handle_error_dispatches_to_api_key_handler(self, capsys):
-        """Test handle_error dispatches APIKeyMissingError correctly."""
-        error = APIKeyMissingError("Key not found")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_error(error)
-
-        captured = capsys.readouterr()
-        assert "API Key Missing" in captured.out
-
-    def test_handle_error_dispatches_to_video_handler(self, capsys):
-        """Test handle_error dispatches VideoDownloadError correctly."""
-        error = VideoDownloadError("Download failed")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_error(error)
-
-        captured = capsys.readouterr()
-        assert "Video Download Failed" in captured.out
-
-    def test_handle_error_dispatches_to_transcription_handler(
-        self, capsys,
-    ):
-        """Test handle_error dispatches TranscriptionError correctly."""
-        error = TranscriptionError("Transcription failed")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_error(error)
-
-        captured = capsys.readouterr()
-        assert "Transcription Failed" in captured.out
-
-    def test_handle_error_dispatches_to_tts_handler(self, capsys):
-        """Test handle_error dispatches TTSError correctly."""
-        error = TTSError("TTS failed")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_error(error)
-
-        captured = capsys.readouterr()
-        assert "Text-to-Speech Failed" in captured.out
-
-    def test_handle_error_dispatches_to_audio_conversion_handler(
-        self, capsys,
-    ):
-        """Test handle_error dispatches AudioConversionError correctly."""
-        error = AudioConversionError("Conversion failed")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_error(error)
-
-        captured = capsys.readouterr()
-        assert "Audio Conversion Failed" in captured.out
-
-    def test_handle_error_dispatches_to_invalid_audio_handler(
-        self, capsys,
-    ):
-        """Test handle_error dispatches InvalidAudioError correctly."""
-        error = InvalidAudioError("Invalid format")
-
-        with pytest.raises(SystemExit):
-            error_handler.handle_error(error)
-
-        captured = capsys.readouterr()
-        assert "Invalid Audio File" in captured.out
-
-    def test_handle_error_dispatches_to_general_handler(self, capsys):
-        """Test handle_error dispatches generic exceptions correctly."""
-        error = RuntimeError("Unknown error")
+# Immutable type -> header map drives the dispatch test directly
+_EXPECTED_HEADER = MappingProxyType({
+    APIKeyMissingError: "API Key Missing",
+    VideoDownloadError: "Video Download Failed",
+    TranscriptionError: "Transcription Failed",
+    TTSError: "Text-to-Speech Failed",
+    AudioConversionError: "Audio Conversion Failed",
+    InvalidAudioError: "Invalid Audio File",
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _needle_pattern(needles):
+    """Compile one alternation pattern for a needle group."""
+    return re.compile(
+        "|".join(
+            f"(?i:{re.escape(needle)})"
+            if needle == needle.lower()
+            else re.escape(needle)
+            for needle in needles
+        ),
+    )
+
+
+def _assert_all_present(text, needles):
+    """
+    Assert each needle appears; all-lowercase needles ignore case.
+
+    The needles are folded into one cached regex so the output is
+    scanned once per assertion instead of once per needle.
+    """
+    pattern = _needle_pattern(tuple(sorted(needles)))
+    found = {match.casefold() for match in pattern.findall(text)}
+    missing = [n for n in needles if n.casefold() not in found]
+    assert not missing, f"{missing!r} not in handler output"
 
-        with pytest.raises(SystemExit):
-            error_handler.handle_error(error)
 
-        captured = capsys.readouterr()
-        assert "Error" in captured.out
-        assert "Unknown error" in captured.out
+class TestErrorHandlers:
+    """Test suite for error handler functions."""
 
-    def test_all_error_handlers_show_suggestions(self, capsys):
+    @pytest.mark.parametrize("case", HANDLER_CASES, ids=lambda case: case.id)
+    def test_error_handler(self, case):
+        """Test each handler renders its header and suggestions."""
+        _assert_all_present(case.renderer(case.exc(case.msg)), case.needles)
+
+    @pytest.mark.parametrize(
+        ("exc_cls", "header"),
+        list(_EXPECTED_HEADER.items()),
+        ids=[cls.__name__ for cls in _EXPECTED_HEADER],
+    )
+    def test_handle_error_dispatches(self, exc_cls, header):
+        """Test errors are dispatched to the matching renderer."""
+        assert header in _render_for(exc_cls("test"))
+
+    def test_handle_error_falls_back_to_general(self):
+        """Test unmapped exceptions use the general renderer."""
+        _assert_all_present(
+            _render_for(RuntimeError("Unknown error")),
+            ("Error", "Unknown error"),
+        )
+
+    def test_all_error_handlers_show_suggestions(self):
         """Test that all error handlers provide actionable suggestions."""
-        error_test_cases = [
-            APIKeyMissingError("test"),
-            VideoDownloadError("test"),
-            TranscriptionError("test"),
-            TTSError("test"),
-            AudioConversionError("test"),
-            InvalidAudioError("test"),
-        ]
-
-        for error in error_test_cases:
-            with pytest.raises(SystemExit):
-                error_handler.handle_error(error)
-
-            captured = capsys.readouterr()
+        # Instances are built inside the loop so each is allocated
+        # only when its case runs
+        error_classes = (
+            APIKeyMissingError,
+            VideoDownloadError,
+            TranscriptionError,
+            TTSError,
+            AudioConversionError,
+            InvalidAudioError,
+        )
+
+        for exc_cls in error_classes:
             # All error handlers should provide meaningful output
-            assert len(captured.out) > 50
-
-    def test_error_handlers_exit_with_code_1(self):
+            assert len(_render_for(exc_cls("test"))) > 50
+
+    @pytest.mark.parametrize(
+        "exc_cls",
+        [
+            APIKeyMissingError,
+            VideoDownloadError,
+            TranscriptionError,
+            TTSError,
+            AudioConversionError,
+            InvalidAudioError,
+            Exception,
+        ],
+        ids=["api", "video", "trans", "tts", "conv", "invalid", "generic"],
+    )
+    def test_error_handlers_exit_with_code_1(self, exc_cls):
         """Test that all error handlers exit with code 1."""
-        errors = [
-            APIKeyMissingError("test"),
-            VideoDownloadError("test"),
-            TranscriptionError("test"),
-            TTSError("test"),
-            AudioConversionError("test"),
-            InvalidAudioError("test"),
-            Exception("test"),
-        ]
-
-        for error in errors:
-            with pytest.raises(SystemExit) as excinfo:
-                error_handler.handle_error(error)
-            assert excinfo.value.code == 1
+        with pytest.raises(SystemExit) as excinfo:
+            handle_error(exc_cls("test"))
+        assert excinfo.value.code == 1
@@ -1,24 +1,58 @@
 """Tests for rate_limiter module."""
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
 
 from ei_cli.core.rate_limiter import RateLimiter
 
+# Keep this module on a single xdist worker so its module-scoped
+# executor fixture is built once
+pytestmark = pytest.mark.xdist_group("rate_limiter")
+
+
+class FakeClock:
+    """Controllable clock standing in for time.time and time.sleep."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    advance = sleep
+
+
+@pytest.fixture
+def clock():
+    """Fresh fake clock; TTL tests advance it instead of sleeping."""
+    return FakeClock()
+
+
+@pytest.fixture(scope="module")
+def executor():
+    """Shared worker pool so concurrency tests skip thread start-up."""
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        yield pool
+
 
 class TestRateLimiter:
     """Test RateLimiter class."""
 
-    def test_init(self):
+    def test_init(self, make_limiter):
         """Test RateLimiter initialization."""
-        limiter = RateLimiter(max_requests=5, window_seconds=60)
+        limiter = make_limiter(max_requests=5, window_seconds=60)
 
         assert limiter.max_requests == 5
         assert limiter.window_seconds == 60
         assert len(limiter.requests) == 0
 
-    def test_can_proceed_allows_requests_under_limit(self):
+    def test_can_proceed_allows_requests_under_limit(self, make_limiter):
         """Test that requests under limit are allowed."""
-        limiter = RateLimiter(max_requests=3, window_seconds=1)
+        limiter = make_limiter(max_requests=3, window_seconds=1)
 
         # First 3 requests should succeed
         can_proceed, wait_time = limiter.can_proceed()
@@ -33,9 +67,9 @@ class TestRateLimiter:
         assert can_proceed is True
         assert wait_time == 0.0
 
-    def test_can_proceed_blocks_requests_over_limit(self):
+    def test_can_proceed_blocks_requests_over_limit(self, make_limiter):
         """Test that requests over limit are blocked."""
-        limiter = RateLimiter(max_requests=2, window_seconds=1)
+        limiter = make_limiter(max_requests=2, window_seconds=1)
 
         # First 2 requests succeed
         limiter.can_proceed()
@@ -47,9 +81,11 @@ class TestRateLimiter:
         assert wait_time > 0.0
         assert wait_time <= 1.0
 
-    def test_sliding_window_expires_old_requests(self):
+    def test_sliding_window_expires_old_requests(self, clock):
         """Test that old requests expire and allow new ones."""
-        limiter = RateLimiter(max_requests=2, window_seconds=0.5)
+        limiter = RateLimiter(
+            max_requests=2, window_seconds=0.5, time_func=clock.time,
+        )
 
         # Fill the limit
         limiter.can_proceed()
@@ -59,41 +95,46 @@ class TestRateLimiter:
         can_proceed, _ = limiter.can_proceed()
         assert can_proceed is False
 
-        # Wait for window to expire
-        time.sleep(0.6)
+        # Advance past the window
+        clock.advance(0.6)
 
         # Should allow new request after window expires
         can_proceed, wait_time = limiter.can_proceed()
         assert can_proceed is True
         assert wait_time == 0.0
 
-    def test_wait_if_needed_waits_when_limit_exceeded(self):
+    def test_wait_if_needed_waits_when_limit_exceeded(self, clock):
         """Test that wait_if_needed actually waits."""
-        limiter = RateLimiter(max_requests=2, window_seconds=0.5)
+        limiter = RateLimiter(
+            max_requests=2,
+            window_seconds=0.5,
+            time_func=clock.time,
+            sleep_func=clock.sleep,
+        )
 
         # Fill the limit
         limiter.can_proceed()
         limiter.can_proceed()
 
-        # This should wait
-        start = time.time()
+        # This should wait (on the fake clock, not the wall clock)
+        start = clock.time()
         wait_time = limiter.wait_if_needed()
-        elapsed = time.time() - start
+        elapsed = clock.time() - start
 
-        assert wait_time > 0.0
-        # Should have waited ~0.5s (with small tolerance)
-        assert elapsed >= 0.4
+        # The fake clock is exact, so no tolerance is needed
+        assert wait_time == 0.5
+        assert elapsed == 0.5
 
-    def test_wait_if_needed_no_wait_when_under_limit(self):
+    def test_wait_if_needed_no_wait_when_under_limit(self, make_limiter):
         """Test that wait_if_needed returns immediately when under limit."""
-        limiter = RateLimiter(max_requests=2, window_seconds=1)
+        limiter = make_limiter(max_requests=2, window_seconds=1)
 
         wait_time = limiter.wait_if_needed()
         assert wait_time == 0.0
 
-    def test_reset_clears_requests(self):
+    def test_reset_clears_requests(self, make_limiter):
         """Test that reset clears all tracked requests."""
-        limiter = RateLimiter(max_requests=2, window_seconds=60)
+        limiter = make_limiter(max_requests=2, window_seconds=60)
 
         # Add requests
         limiter.can_proceed()
@@ -104,9 +145,9 @@ class TestRateLimiter:
         limiter.reset()
         assert limiter.get_current_count() == 0
 
-    def test_get_current_count(self):
+    def test_get_current_count(self, make_limiter):
         """Test get_current_count returns accurate count."""
-        limiter = RateLimiter(max_requests=5, window_seconds=1)
+        limiter = make_limiter(max_requests=5, window_seconds=1)
 
         assert limiter.get_current_count() == 0
 
@@ -117,21 +158,23 @@ class TestRateLimiter:
         limiter.can_proceed()
         assert limiter.get_current_count() == 3
 
-    def test_get_current_count_removes_expired(self):
+    def test_get_current_count_removes_expired(self, clock):
         """Test that get_current_count removes expired requests."""
-        limiter = RateLimiter(max_requests=5, window_seconds=0.5)
+        limiter = RateLimiter(
+            max_requests=5, window_seconds=0.5, time_func=clock.time,
+        )
 
         limiter.can_proceed()
         limiter.can_proceed()
         assert limiter.get_current_count() == 2
 
-        # Wait for expiration
-        time.sleep(0.6)
+        # Advance past the window
+        clock.advance(0.6)
         assert limiter.get_current_count() == 0
 
-    def test_get_availability(self):
+    def test_get_availability(self, make_limiter):
         """Test get_availability returns correct used/available counts."""
-        limiter = RateLimiter(max_requests=5, window_seconds=1)
+        limiter = make_limiter(max_requests=5, window_seconds=1)
 
         used, available = limiter.get_availability()
         assert used == 0
@@ -144,52 +187,45 @@ class TestRateLimiter:
         assert used == 2
         assert available == 3
 
-    def test_repr(self):
+    def test_repr(self, make_limiter):
         """Test string representation."""
-        limiter = RateLimiter(max_requests=5, window_seconds=60)
+        limiter = make_limiter(max_requests=5, window_seconds=60)
         limiter.can_proceed()
 
         repr_str = repr(limiter)
-        assert "RateLimiter" in repr_str
-        assert "max=5" in repr_str
-        assert "window=60s" in repr_str
-        assert "used=1" in repr_str
-        assert "available=4" in repr_str
+        expected = ("RateLimiter", "max=5", "window=60s", "used=1", "available=4")
+        missing = [part for part in expected if part not in repr_str]
+        assert not missing, f"missing substrings: {missing}"
 
-    def test_thread_safety(self):
+    def test_thread_safety(self, executor, make_limiter):
         """Test that rate limiter is thread-safe."""
-        limiter = RateLimiter(max_requests=10, window_seconds=1)
-        results = []
+        limiter = make_limiter(max_requests=10, window_seconds=1)
+        # Barrier releases all workers at once to maximize contention
+        barrier = threading.Barrier(20)
 
         def make_request():
+            barrier.wait()
             can_proceed, _ = limiter.can_proceed()
-            results.append(can_proceed)
-
-        # Create 20 threads trying to make requests
-        threads = [threading.Thread(target=make_request) for _ in range(20)]
-
-        # Start all threads
-        for thread in threads:
-            thread.start()
+            return can_proceed
 
-        # Wait for all threads
-        for thread in threads:
-            thread.join()
+        results = list(executor.map(lambda _: make_request(), range(20)))
 
         # Should have exactly 10 successes (the limit)
         assert sum(1 for r in results if r) == 10
         assert sum(1 for r in results if not r) == 10
 
-    def test_multiple_wait_cycles(self):
+    def test_multiple_wait_cycles(self, clock):
         """Test that multiple wait cycles work correctly."""
-        limiter = RateLimiter(max_requests=2, window_seconds=0.3)
+        limiter = RateLimiter(
+            max_requests=2, window_seconds=0.3, time_func=clock.time,
+        )
 
         # First batch
         limiter.can_proceed()
         limiter.can_proceed()
 
-        # Wait and make another request
-        time.sleep(0.4)
+        # Advance and make another request
+        clock.advance(0.4)
         can_proceed, _ = limiter.can_proceed()
         assert can_proceed is True
 
@@ -200,18 +236,18 @@ class TestRateLimiter:
         can_proceed, _ = limiter.can_proceed()
         assert can_proceed is False
 
-    def test_zero_wait_time_when_slots_available(self):
+    def test_zero_wait_time_when_slots_available(self, make_limiter):
         """Test that wait time is zero when slots are available."""
-        limiter = RateLimiter(max_requests=5, window_seconds=60)
+        limiter = make_limiter(max_requests=5, window_seconds=60)
 
         for _ in range(5):
             can_proceed, wait_time = limiter.can_proceed()
             assert can_proceed is True
             assert wait_time == 0.0
 
-    def test_accurate_wait_time_calculation(self):
+    def test_accurate_wait_time_calculation(self, make_limiter):
         """Test that wait time is calculated accurately."""
-        limiter = RateLimiter(max_requests=1, window_seconds=1.0)
+        limiter = make_limiter(max_requests=1, window_seconds=1.0)
 
         # First request succeeds
         can_proceed, _ = limiter.can_proceed()
@@ -0,0 +1,49 @@
+"""Shared fixtures for workflow tests."""
+import os
+import shutil
+
+import pytest
+
+from ei_cli.workflow.interactive import InteractiveWorkflow, WorkflowMode
+
+
+@pytest.fixture(scope="module")
+def headless_workflow():
+    """
+    Module-scoped headless workflow.
+
+    InteractiveWorkflow only stores its mode, so one instance can be
+    shared across tests instead of re-running construction each time.
+    """
+    return InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
+
+
+@pytest.fixture(scope="module")
+def interactive_workflow():
+    """Module-scoped interactive workflow; see headless_workflow."""
+    return InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
+
+
+@pytest.fixture(scope="session")
+def _canonical_test_file(tmp_path_factory):
+    """Write the canonical test artifact once per session."""
+    path = tmp_path_factory.mktemp("data") / "test.txt"
+    path.write_text("test content")
+    return path
+
+
+@pytest.fixture
+def test_file(tmp_path, _canonical_test_file):
+    """
+    Per-test copy of the canonical artifact.
+
+    Hardlinked into the test's tmp dir so tests that unlink or mutate
+    it stay isolated without rewriting the content each time.
+    """
+    target = tmp_path / "test.txt"
+    try:
+        os.link(_canonical_test_file, target)
+    except OSError:
+        # Hardlinks can fail across filesystems; fall back to a copy
+        shutil.copy(_canonical_test_file, target)
+    return target
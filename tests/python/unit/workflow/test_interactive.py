@@ -1,10 +1,11 @@
 """Tests for interactive workflow management."""
 
-import os
-from unittest.mock import patch
+import sys
+from unittest.mock import MagicMock
 
 import pytest
 
+from ei_cli.workflow import interactive as iw_mod
 from ei_cli.workflow.interactive import (
     InteractiveWorkflow,
     RecoveryAction,
@@ -12,205 +13,212 @@ from ei_cli.workflow.interactive import (
     with_error_recovery,
 )
 
+# Keep this module on a single xdist worker so its module-scoped
+# workflow fixtures are built once
+pytestmark = pytest.mark.xdist_group("interactive_workflow")
+
+
+@pytest.fixture(autouse=True)
+def mock_console(monkeypatch):
+    """Swap the module console for a MagicMock in every test."""
+    mock = MagicMock()
+    monkeypatch.setattr(iw_mod, "console", mock)
+    return mock
+
 
 class TestWorkflowMode:
     """Tests for WorkflowMode enum."""
 
-    def test_modes_exist(self):
-        """Test all workflow modes are defined."""
-        assert WorkflowMode.INTERACTIVE.value == "interactive"
-        assert WorkflowMode.AUTO.value == "auto"
-        assert WorkflowMode.HEADLESS.value == "headless"
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [
+            ("INTERACTIVE", "interactive"),
+            ("AUTO", "auto"),
+            ("HEADLESS", "headless"),
+        ],
+    )
+    def test_modes_exist(self, name, value):
+        """Test each workflow mode is defined with its value."""
+        assert WorkflowMode[name].value == value
 
 
 class TestRecoveryAction:
     """Tests for RecoveryAction enum."""
 
-    def test_actions_exist(self):
-        """Test all recovery actions are defined."""
-        assert RecoveryAction.RETRY.value == "retry"
-        assert RecoveryAction.SKIP.value == "skip"
-        assert RecoveryAction.ABORT.value == "abort"
-        assert RecoveryAction.CONTINUE.value == "continue"
+    @pytest.mark.parametrize(
+        ("name", "value"),
+        [
+            ("RETRY", "retry"),
+            ("SKIP", "skip"),
+            ("ABORT", "abort"),
+            ("CONTINUE", "continue"),
+        ],
+    )
+    def test_actions_exist(self, name, value):
+        """Test each recovery action is defined with its value."""
+        assert RecoveryAction[name].value == value
 
 
 class TestInteractiveWorkflow:
     """Tests for InteractiveWorkflow class."""
 
-    @patch("sys.stdin.isatty", return_value=True)
-    @patch("sys.stdout.isatty", return_value=True)
-    def test_init_default(self, mock_stdout_isatty, mock_stdin_isatty):
+    def test_init_default(self, monkeypatch):
         """Test default initialization."""
-        with patch.dict(os.environ, {}, clear=True):
-            workflow = InteractiveWorkflow()
-            assert workflow.mode == WorkflowMode.INTERACTIVE
+        for var in ("CI", "CONTINUOUS_INTEGRATION", "GITHUB_ACTIONS", "GITLAB_CI"):
+            monkeypatch.delenv(var, raising=False)
+        monkeypatch.setattr(sys.stdin, "isatty", lambda: True)
+        monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
+
+        workflow = InteractiveWorkflow()
+
+        assert workflow.mode == WorkflowMode.INTERACTIVE
 
     def test_init_custom_mode(self):
         """Test custom mode initialization."""
         workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
         assert workflow.mode == WorkflowMode.HEADLESS
 
-    def test_detect_mode_ci(self):
-        """Test CI environment detection."""
-        with patch.dict(os.environ, {"CI": "true"}):
-            workflow = InteractiveWorkflow()
-            assert workflow.mode == WorkflowMode.HEADLESS
+    @pytest.mark.parametrize(
+        "var",
+        ["CI", "CONTINUOUS_INTEGRATION", "GITHUB_ACTIONS", "GITLAB_CI"],
+    )
+    def test_detect_mode_headless_env(self, var, monkeypatch):
+        """Test each recognized CI variable forces headless mode."""
+        monkeypatch.setenv(var, "true")
+
+        workflow = InteractiveWorkflow()
 
-    def test_detect_mode_github_actions(self):
-        """Test GitHub Actions detection."""
-        with patch.dict(os.environ, {"GITHUB_ACTIONS": "true"}):
-            workflow = InteractiveWorkflow()
-            assert workflow.mode == WorkflowMode.HEADLESS
+        assert workflow.mode == WorkflowMode.HEADLESS
 
-    def test_is_interactive(self):
+    def test_is_interactive(self, interactive_workflow, headless_workflow):
         """Test is_interactive check."""
-        workflow_interactive = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
-        workflow_headless = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
+        assert interactive_workflow.is_interactive() is True
+        assert headless_workflow.is_interactive() is False
 
-        assert workflow_interactive.is_interactive() is True
-        assert workflow_headless.is_interactive() is False
-
-    @patch("ei_cli.workflow.interactive.Confirm.ask")
-    def test_confirm_step_interactive_yes(self, mock_confirm):
+    def test_confirm_step_interactive_yes(self, monkeypatch, interactive_workflow):
         """Test confirm_step in interactive mode with yes."""
-        mock_confirm.return_value = True
+        mock_confirm = MagicMock(return_value=True)
+        monkeypatch.setattr(iw_mod.Confirm, "ask", mock_confirm)
 
-        workflow = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
-        result = workflow.confirm_step("Download video")
+        result = interactive_workflow.confirm_step("Download video")
 
         assert result is True
         mock_confirm.assert_called_once()
 
-    @patch("ei_cli.workflow.interactive.Confirm.ask")
-    def test_confirm_step_interactive_no(self, mock_confirm):
+    def test_confirm_step_interactive_no(self, monkeypatch, interactive_workflow):
         """Test confirm_step in interactive mode with no."""
-        mock_confirm.return_value = False
+        mock_confirm = MagicMock(return_value=False)
+        monkeypatch.setattr(iw_mod.Confirm, "ask", mock_confirm)
 
-        workflow = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
-        result = workflow.confirm_step("Download video")
+        result = interactive_workflow.confirm_step("Download video")
 
         assert result is False
         mock_confirm.assert_called_once()
 
-    def test_confirm_step_headless_default_true(self):
-        """Test confirm_step in headless mode with default=True."""
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-        result = workflow.confirm_step("Download video", default=True)
+    @pytest.mark.parametrize(
+        ("default", "expected"),
+        [(True, True), (False, False)],
+        ids=["default_true", "default_false"],
+    )
+    def test_confirm_step_headless(self, headless_workflow, default, expected):
+        """Test confirm_step in headless mode returns the default."""
+        result = headless_workflow.confirm_step("Download video", default=default)
 
-        assert result is True
-
-    def test_confirm_step_headless_default_false(self):
-        """Test confirm_step in headless mode with default=False."""
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-        result = workflow.confirm_step("Download video", default=False)
+        assert result is expected
 
-        assert result is False
-
-    @patch("ei_cli.workflow.interactive.Confirm.ask")
-    def test_confirm_step_expensive(self, mock_confirm):
+    def test_confirm_step_expensive(self, monkeypatch, interactive_workflow):
         """Test confirm_step with expensive=True shows warning."""
-        mock_confirm.return_value = True
+        monkeypatch.setattr(iw_mod.Confirm, "ask", MagicMock(return_value=True))
 
-        workflow = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
-        result = workflow.confirm_step(
+        result = interactive_workflow.confirm_step(
             "Process large file",
             expensive=True,
         )
 
         assert result is True
 
-    @patch("ei_cli.workflow.interactive.Prompt.ask")
-    def test_handle_error_interactive_retry(self, mock_prompt):
+    def test_handle_error_interactive_retry(self, monkeypatch, interactive_workflow):
         """Test handle_error returns retry action."""
-        mock_prompt.return_value = "1"  # First option (retry)
+        # First option (retry)
+        monkeypatch.setattr(iw_mod.Prompt, "ask", MagicMock(return_value="1"))
 
-        workflow = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
         error = ValueError("Test error")
 
-        action = workflow.handle_error(error)
+        action = interactive_workflow.handle_error(error)
 
         assert action == RecoveryAction.RETRY
 
-    @patch("ei_cli.workflow.interactive.Prompt.ask")
-    def test_handle_error_interactive_abort(self, mock_prompt):
+    def test_handle_error_interactive_abort(self, monkeypatch, interactive_workflow):
         """Test handle_error returns abort action."""
-        mock_prompt.return_value = "3"  # Third option (abort)
+        # Third option (abort)
+        monkeypatch.setattr(iw_mod.Prompt, "ask", MagicMock(return_value="3"))
 
-        workflow = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
         error = ValueError("Test error")
 
-        action = workflow.handle_error(error)
+        action = interactive_workflow.handle_error(error)
 
         assert action == RecoveryAction.ABORT
 
-    def test_handle_error_headless(self):
+    def test_handle_error_headless(self, headless_workflow):
         """Test handle_error in headless mode always aborts."""
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
         error = ValueError("Test error")
 
-        action = workflow.handle_error(error)
+        action = headless_workflow.handle_error(error)
 
         assert action == RecoveryAction.ABORT
 
-    @patch("ei_cli.workflow.interactive.Prompt.ask")
-    def test_prompt_choice_interactive(self, mock_prompt):
+    def test_prompt_choice_interactive(self, monkeypatch, interactive_workflow):
         """Test prompt_choice in interactive mode."""
-        mock_prompt.return_value = "2"
+        monkeypatch.setattr(iw_mod.Prompt, "ask", MagicMock(return_value="2"))
 
-        workflow = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
-        choice = workflow.prompt_choice(
+        choice = interactive_workflow.prompt_choice(
             "Select option",
             ["Option 1", "Option 2", "Option 3"],
         )
 
         assert choice == "Option 2"
 
-    def test_prompt_choice_headless_with_default(self):
-        """Test prompt_choice in headless mode uses default."""
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-        choice = workflow.prompt_choice(
+    @pytest.mark.parametrize(
+        ("default", "expected"),
+        [("Option 2", "Option 2"), (None, "Option 1")],
+        ids=["with_default", "no_default"],
+    )
+    def test_prompt_choice_headless(self, headless_workflow, default, expected):
+        """Test prompt_choice in headless mode uses default or first option."""
+        choice = headless_workflow.prompt_choice(
             "Select option",
             ["Option 1", "Option 2", "Option 3"],
-            default="Option 2",
+            default=default,
         )
 
-        assert choice == "Option 2"
+        assert choice == expected
 
-    def test_prompt_choice_headless_no_default(self):
-        """Test prompt_choice in headless mode uses first option."""
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-        choice = workflow.prompt_choice(
-            "Select option",
-            ["Option 1", "Option 2", "Option 3"],
-        )
-
-        assert choice == "Option 1"
-
-    @patch("ei_cli.workflow.interactive.Prompt.ask")
-    def test_prompt_input_interactive(self, mock_prompt):
+    def test_prompt_input_interactive(self, monkeypatch, interactive_workflow):
         """Test prompt_input in interactive mode."""
-        mock_prompt.return_value = "user input"
+        monkeypatch.setattr(
+            iw_mod.Prompt, "ask", MagicMock(return_value="user input"),
+        )
 
-        workflow = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
-        result = workflow.prompt_input("Enter value")
+        result = interactive_workflow.prompt_input("Enter value")
 
         assert result == "user input"
 
-    def test_prompt_input_headless_with_default(self):
-        """Test prompt_input in headless mode uses default."""
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-        result = workflow.prompt_input("Enter value", default="default value")
+    @pytest.mark.parametrize(
+        "default",
+        ["default value", None],
+        ids=["with_default", "no_default"],
+    )
+    def test_prompt_input_headless(self, headless_workflow, default):
+        """Test prompt_input in headless mode uses default or raises."""
+        if default is None:
+            with pytest.raises(ValueError, match="No default provided"):
+                headless_workflow.prompt_input("Enter value")
+        else:
+            result = headless_workflow.prompt_input(
+                "Enter value", default=default,
+            )
+            assert result == default
 
-        assert result == "default value"
-
-    def test_prompt_input_headless_no_default_raises(self):
-        """Test prompt_input in headless mode without default raises."""
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-
-        with pytest.raises(ValueError, match="No default provided"):
-            workflow.prompt_input("Enter value")
-
-    @patch("ei_cli.workflow.interactive.console")
     def test_show_progress_step(self, mock_console):
         """Test show_progress_step displays correctly."""
         workflow = InteractiveWorkflow()
@@ -218,7 +226,6 @@ class TestInteractiveWorkflow:
 
         mock_console.print.assert_called_once()
 
-    @patch("ei_cli.workflow.interactive.console")
     def test_show_completion(self, mock_console):
         """Test show_completion displays message."""
         workflow = InteractiveWorkflow()
@@ -226,7 +233,6 @@ class TestInteractiveWorkflow:
 
         assert mock_console.print.call_count >= 1
 
-    @patch("ei_cli.workflow.interactive.console")
     def test_show_completion_with_details(self, mock_console):
         """Test show_completion with details."""
         workflow = InteractiveWorkflow()
@@ -237,15 +243,12 @@ class TestInteractiveWorkflow:
 
         assert mock_console.print.call_count >= 2
 
-    @patch("ei_cli.workflow.interactive.console")
-    def test_show_warning_interactive(self, mock_console):
+    def test_show_warning_interactive(self, mock_console, interactive_workflow):
         """Test show_warning in interactive mode."""
-        workflow = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
-        workflow.show_warning("This is a warning")
+        interactive_workflow.show_warning("This is a warning")
 
         mock_console.print.assert_called_once()
 
-    @patch("ei_cli.workflow.interactive.console")
     def test_show_warning_auto_skip(self, mock_console):
         """Test show_warning skips in auto mode."""
         workflow = InteractiveWorkflow(mode=WorkflowMode.AUTO)
@@ -253,19 +256,37 @@ class TestInteractiveWorkflow:
 
         mock_console.print.assert_not_called()
 
-    def test_repr(self):
+    def test_repr(self, interactive_workflow):
         """Test string representation."""
-        workflow = InteractiveWorkflow(mode=WorkflowMode.INTERACTIVE)
-        repr_str = repr(workflow)
+        repr_str = repr(interactive_workflow)
 
         assert "InteractiveWorkflow" in repr_str
         assert "interactive" in repr_str
 
 
+def _always_fails():
+    """Module-level failing callable shared by the recovery tests."""
+    raise ValueError("Always fails")
+
+
+class RetryWorkflow(InteractiveWorkflow):
+    """Workflow whose error handler always chooses retry."""
+
+    def handle_error(self, error, **kwargs):
+        """Return RETRY without prompting."""
+        return RecoveryAction.RETRY
+
+
+@pytest.fixture(scope="module")
+def retry_workflow():
+    """Module-scoped always-retry workflow; see headless_workflow."""
+    return RetryWorkflow(mode=WorkflowMode.HEADLESS)
+
+
 class TestWithErrorRecovery:
     """Tests for with_error_recovery function."""
 
-    def test_success_no_retry(self):
+    def test_success_no_retry(self, headless_workflow):
         """Test function succeeds without retry."""
         call_count = 0
 
@@ -274,17 +295,15 @@ class TestWithErrorRecovery:
             call_count += 1
             return "success"
 
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-        result = with_error_recovery(func, max_retries=3, workflow=workflow)
+        result = with_error_recovery(
+            func, max_retries=3, workflow=headless_workflow,
+        )
 
         assert result == "success"
         assert call_count == 1
 
-    @patch("ei_cli.workflow.interactive.InteractiveWorkflow.handle_error")
-    def test_retry_then_success(self, mock_handle_error):
+    def test_retry_then_success(self, retry_workflow):
         """Test function fails once then succeeds."""
-        mock_handle_error.return_value = RecoveryAction.RETRY
-
         call_count = 0
 
         def func():
@@ -294,31 +313,23 @@ class TestWithErrorRecovery:
                 raise ValueError("First attempt fails")
             return "success"
 
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-        result = with_error_recovery(func, max_retries=3, workflow=workflow)
+        result = with_error_recovery(
+            func, max_retries=3, workflow=retry_workflow,
+        )
 
         assert result == "success"
         assert call_count == 2
 
-    @patch("ei_cli.workflow.interactive.InteractiveWorkflow.handle_error")
-    def test_abort_on_error(self, mock_handle_error):
-        """Test function aborts on error."""
-        mock_handle_error.return_value = RecoveryAction.ABORT
-
-        def func():
-            raise ValueError("Error")
-
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-
-        with pytest.raises(ValueError, match="Error"):
-            with_error_recovery(func, max_retries=3, workflow=workflow)
+    def test_abort_on_error(self, headless_workflow):
+        """Test function aborts on error (headless mode always aborts)."""
+        with pytest.raises(ValueError, match="Always fails"):
+            with_error_recovery(
+                _always_fails, max_retries=3, workflow=headless_workflow,
+            )
 
-    def test_max_retries_exhausted(self):
+    def test_max_retries_exhausted(self, headless_workflow):
         """Test all retries exhausted raises error."""
-        def func():
-            raise ValueError("Always fails")
-
-        workflow = InteractiveWorkflow(mode=WorkflowMode.HEADLESS)
-
         with pytest.raises(ValueError, match="Always fails"):
-            with_error_recovery(func, max_retries=2, workflow=workflow)
+            with_error_recovery(
+                _always_fails, max_retries=2, workflow=headless_workflow,
+            )
@@ -1,10 +1,12 @@
 """Tests for workflow parallel execution."""
 
 import asyncio
+import importlib
 from unittest.mock import patch
 
 import pytest
 
+from ei_cli.workflow import parallel as parallel_mod
 from ei_cli.workflow.parallel import ParallelExecutor, run_parallel, run_parallel_async
 
 
@@ -12,9 +14,22 @@ class TestParallelExecutor:
     """Tests for ParallelExecutor class."""
 
     def test_init_default(self):
-        """Test default initialization."""
+        """Test default initialization scales with the host CPU count."""
         executor = ParallelExecutor()
-        assert executor.max_workers == 3
+        assert executor.max_workers == parallel_mod._DEFAULT_MAX_WORKERS
+        assert 1 <= executor.max_workers <= 32
+
+    def test_init_default_respects_env(self, monkeypatch):
+        """Test EI_CLI_MAX_WORKERS overrides the computed default."""
+        monkeypatch.setenv("EI_CLI_MAX_WORKERS", "7")
+        try:
+            reloaded = importlib.reload(parallel_mod)
+            assert reloaded.ParallelExecutor().max_workers == 7
+        finally:
+            # Re-import with the variable gone so later tests see the
+            # computed default again
+            monkeypatch.delenv("EI_CLI_MAX_WORKERS")
+            importlib.reload(parallel_mod)
 
     def test_init_custom(self):
         """Test custom initialization."""
@@ -25,15 +40,15 @@ class TestParallelExecutor:
     async def test_run_parallel_async_success(self):
         """Test async parallel execution with all successful tasks."""
         async def task1():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)  # yield once; timing is not under test
             return "result1"
 
         async def task2():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)  # yield once; timing is not under test
             return "result2"
 
         async def task3():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)  # yield once; timing is not under test
             return "result3"
 
         executor = ParallelExecutor()
@@ -51,16 +66,16 @@ class TestParallelExecutor:
     async def test_run_parallel_async_with_errors(self):
         """Test async execution with some tasks failing."""
         async def task1():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)  # yield once; timing is not under test
             return "result1"
 
         async def task2():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)  # yield once; timing is not under test
             msg = "Task 2 failed"
             raise ValueError(msg)
 
         async def task3():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)  # yield once; timing is not under test
             return "result3"
 
         executor = ParallelExecutor()
@@ -79,6 +94,78 @@ class TestParallelExecutor:
         # Check error is captured
         assert any(isinstance(r, ValueError) for r in results)
 
+    @pytest.mark.asyncio
+    async def test_async_respects_semaphore(self):
+        """Test in-flight async tasks never exceed max_workers."""
+        state = {"current": 0, "peak": 0}
+
+        async def task():
+            state["current"] += 1
+            state["peak"] = max(state["peak"], state["current"])
+            await asyncio.sleep(0)
+            state["current"] -= 1
+            return "ok"
+
+        executor = ParallelExecutor(max_workers=3)
+        results = await executor.run_parallel_async(
+            tasks=[task] * 20,
+            descriptions=[f"Task {i}" for i in range(20)],
+        )
+
+        assert len(results) == 20
+        assert state["peak"] <= 3
+
+    @pytest.mark.asyncio
+    async def test_iter_parallel_async_streams_results(self):
+        """Test the streaming iterator yields results as tasks finish."""
+        async def fast():
+            return "fast"
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return "slow"
+
+        executor = ParallelExecutor()
+        pairs = [
+            pair
+            async for pair in executor.iter_parallel_async(
+                tasks=[slow, fast],
+                descriptions=["Slow", "Fast"],
+            )
+        ]
+
+        # Completion order: the fast task arrives first
+        assert pairs[0] == ("Fast", "fast")
+        assert pairs[1] == ("Slow", "slow")
+
+    @pytest.mark.asyncio
+    async def test_iter_parallel_async_early_close_cancels_tasks(self):
+        """Test abandoning the iterator cancels the in-flight tasks."""
+        cancelled = asyncio.Event()
+
+        async def fast():
+            return "fast"
+
+        async def hung():
+            try:
+                await asyncio.Event().wait()  # blocks until cancelled
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        executor = ParallelExecutor()
+        iterator = executor.iter_parallel_async(
+            tasks=[hung, fast],
+            descriptions=["Hung", "Fast"],
+        )
+
+        assert await anext(iterator) == ("Fast", "fast")
+        # Must close cleanly: no BaseExceptionGroup, no "exception was
+        # never retrieved" from the still-running task
+        await iterator.aclose()
+
+        assert cancelled.is_set()
+
     def test_run_parallel_sync_success(self):
         """Test sync parallel execution with all successful tasks."""
         def task1():